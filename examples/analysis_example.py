@@ -88,19 +88,11 @@ def show_analysis():
     """Demo endpoint to show error analysis results."""
 
     # Get analysis from decorated functions
-    get_user_analysis = (
-        get_user._error_analysis if hasattr(get_user, "_error_analysis") else None
-    )
-    create_user_analysis = (
-        create_user._error_analysis if hasattr(create_user, "_error_analysis") else None
-    )
+    get_user_analysis = get_user._error_analysis
+    create_user_analysis = create_user._error_analysis
 
     # Get OpenAPI responses
-    get_user_responses = (
-        get_user._openapi_error_responses
-        if hasattr(get_user, "_openapi_error_responses")
-        else None
-    )
+    get_user_responses = get_user._openapi_error_responses
 
     return {
         "get_user_analysis": get_user_analysis,
@@ -115,13 +107,13 @@ if __name__ == "__main__":
     # Print analysis results before starting server
     print("=== Error Analysis Results ===")
 
-    if hasattr(get_user, "_error_analysis"):
+    if get_user._error_analysis is not None:
         print(f"get_user errors: {get_user._error_analysis['error_codes']}")
 
-    if hasattr(create_user, "_error_analysis"):
+    if create_user._error_analysis is not None:
         print(f"create_user errors: {create_user._error_analysis['error_codes']}")
 
-    if hasattr(get_user, "_openapi_error_responses"):
+    if get_user._openapi_error_responses is not None:
         print(
             f"get_user OpenAPI responses: {list(get_user._openapi_error_responses.keys())}"
         )
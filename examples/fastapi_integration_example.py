@@ -91,11 +91,12 @@ def show_error_analysis():
     endpoints = [get_user_openapi, get_post_auto, get_comment_manual]
 
     for endpoint in endpoints:
-        if hasattr(endpoint, "_error_analysis"):
+        if endpoint._error_analysis is not None:
             results[endpoint.__name__] = {
                 "error_codes": endpoint._error_analysis["error_codes"],
-                "has_openapi_responses": hasattr(endpoint, "_openapi_error_responses"),
-                "has_auto_openapi": hasattr(endpoint, "_auto_openapi"),
+                "has_openapi_responses": endpoint._openapi_error_responses
+                is not None,
+                "has_auto_openapi": endpoint._auto_openapi,
             }
 
     return results
@@ -119,11 +120,11 @@ if __name__ == "__main__":
 
     for name, endpoint in endpoints:
         features = []
-        if hasattr(endpoint, "_error_analysis"):
+        if endpoint._error_analysis is not None:
             features.append("error_analysis")
-        if hasattr(endpoint, "_openapi_error_responses"):
+        if endpoint._openapi_error_responses is not None:
             features.append("openapi_responses")
-        if hasattr(endpoint, "_auto_openapi"):
+        if endpoint._auto_openapi:
             features.append("auto_openapi")
 
         print(f"{name}: {', '.join(features) if features else 'none'}")
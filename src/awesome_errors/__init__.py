@@ -1,106 +1,172 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict
-
-from .analysis import ErrorAnalyzer, analyze_errors, openapi_errors
-from .client import BackendError, ErrorResponseParser
-from .converters import (
-    PydanticErrorConverter,
-    PythonErrorConverter,
-    SQLErrorConverter,
-    UniversalErrorConverter,
-)
-from .core.error_codes import ErrorCode
-from .core.error_response import ErrorDetail, ErrorResponse
-from .core.exceptions import (
-    APIError,
-    AppError,
-    AuthError,
-    AuthInsufficientPrivilegesError,
-    AuthInvalidTokenError,
-    AuthPermissionDeniedError,
-    AuthRequiredError,
-    AuthTokenExpiredError,
-    BusinessLogicError,
-    DatabaseConnectionError,
-    DatabaseConstraintViolationError,
-    DatabaseDuplicateEntryError,
-    DatabaseError,
-    DatabaseInvalidReferenceError,
-    DatabaseMissingRequiredError,
-    DatabaseQueryError,
-    DatabaseTransactionError,
-    EntityNotFoundError,
-    InsufficientBalanceError,
-    InvalidFormatError,
-    InvalidInputError,
-    MissingRequiredFieldError,
-    NotFoundError,
-    OAuthProviderUnknownError,
-    OperationNotAllowedError,
-    RefreshTokenReuseDetectedError,
-    ResourceNotFoundError,
-    SessionExpiredError,
-    UserNotFoundError,
-    ValidationError,
-)
-from .core.renderers import ErrorResponseFormat, ErrorResponseRenderer
-from .i18n.translator import ErrorTranslator
-from .litestar_utils import apply_api_errors, errors, raises_from
-from .middleware.litestar import (
-    apply_litestar_openapi_problem_details,
-    create_litestar_exception_handlers,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+# Needed eagerly as a default argument value; core modules are lightweight.
+from .core.renderers import ErrorResponseFormat
 
-_setup_error_handling: Callable[..., Any] | None = None
-try:  # pragma: no cover - optional dependency
-    from .middleware.fastapi import setup_error_handling as _setup_error_handling_impl
-except ImportError:  # pragma: no cover
-    pass
-else:
-    _setup_error_handling = _setup_error_handling_impl
-
-_setup_automatic_error_docs: Callable[..., Any] | None = None
-_apply_auto_error_docs_to_router: Callable[..., Any] | None = None
-_auto_analyze_errors: Callable[..., Any] | None = None
-try:  # pragma: no cover - optional dependency
-    from .integrations.fastapi_auto_docs import (
-        apply_auto_error_docs_to_router as _apply_auto_error_docs_to_router_impl,
+if TYPE_CHECKING:  # pragma: no cover - imports for static analysis only
+    from .analysis import ErrorAnalyzer, analyze_errors, openapi_errors
+    from .client import BackendError, ErrorResponseParser
+    from .converters import (
+        PydanticErrorConverter,
+        PythonErrorConverter,
+        SQLErrorConverter,
+        UniversalErrorConverter,
     )
-    from .integrations.fastapi_auto_docs import (
-        auto_analyze_errors as _auto_analyze_errors_impl,
+    from .core.error_codes import ErrorCode
+    from .core.error_response import ErrorDetail, ErrorResponse
+    from .core.exceptions import (
+        APIError,
+        AppError,
+        AuthError,
+        AuthInsufficientPrivilegesError,
+        AuthInvalidTokenError,
+        AuthPermissionDeniedError,
+        AuthRequiredError,
+        AuthTokenExpiredError,
+        BusinessLogicError,
+        DatabaseConnectionError,
+        DatabaseConstraintViolationError,
+        DatabaseDuplicateEntryError,
+        DatabaseError,
+        DatabaseInvalidReferenceError,
+        DatabaseMissingRequiredError,
+        DatabaseQueryError,
+        DatabaseTransactionError,
+        EntityNotFoundError,
+        InsufficientBalanceError,
+        InvalidFormatError,
+        InvalidInputError,
+        MissingRequiredFieldError,
+        NotFoundError,
+        OAuthProviderUnknownError,
+        OperationNotAllowedError,
+        RefreshTokenReuseDetectedError,
+        ResourceNotFoundError,
+        SessionExpiredError,
+        UserNotFoundError,
+        ValidationError,
     )
-    from .integrations.fastapi_auto_docs import (
-        setup_automatic_error_docs as _setup_automatic_error_docs_impl,
+    from .core.renderers import ErrorResponseRenderer
+    from .i18n.translator import ErrorTranslator
+    from .litestar_utils import apply_api_errors, errors, raises_from
+    from .middleware.litestar import (
+        apply_litestar_openapi_problem_details,
+        create_litestar_exception_handlers,
     )
-except ImportError:  # pragma: no cover
-    pass
-else:
-    _setup_automatic_error_docs = _setup_automatic_error_docs_impl
-    _apply_auto_error_docs_to_router = _apply_auto_error_docs_to_router_impl
-    _auto_analyze_errors = _auto_analyze_errors_impl
-
-_websocket: Any = None
-try:  # pragma: no cover - optional dependency
-    from . import websocket as _websocket_module
-except ImportError:  # pragma: no cover
-    pass
-else:
-    _websocket = _websocket_module
-
-WebSocketError = getattr(_websocket, "WebSocketError", None)
-JSONRPCErrorCode = getattr(_websocket, "JSONRPCErrorCode", None)
-WebSocketAuthError = getattr(_websocket, "WebSocketAuthError", None)
-WebSocketTokenExpiredError = getattr(_websocket, "WebSocketTokenExpiredError", None)
-WebSocketRateLimitError = getattr(_websocket, "WebSocketRateLimitError", None)
-WebSocketValidationError = getattr(_websocket, "WebSocketValidationError", None)
-WebSocketMethodNotFoundError = getattr(_websocket, "WebSocketMethodNotFoundError", None)
-WebSocketInternalError = getattr(_websocket, "WebSocketInternalError", None)
-WebSocketErrorHandler = getattr(_websocket, "WebSocketErrorHandler", None)
-_setup_websocket_error_handling = getattr(
-    _websocket, "setup_websocket_error_handling", None
+    from .websocket import (
+        JSONRPCErrorCode,
+        WebSocketAuthError,
+        WebSocketError,
+        WebSocketErrorHandler,
+        WebSocketInternalError,
+        WebSocketMethodNotFoundError,
+        WebSocketRateLimitError,
+        WebSocketTokenExpiredError,
+        WebSocketValidationError,
+    )
+
+_CORE_EXCEPTIONS = (
+    "APIError",
+    "AppError",
+    "AuthError",
+    "AuthInsufficientPrivilegesError",
+    "AuthInvalidTokenError",
+    "AuthPermissionDeniedError",
+    "AuthRequiredError",
+    "AuthTokenExpiredError",
+    "BusinessLogicError",
+    "DatabaseConnectionError",
+    "DatabaseConstraintViolationError",
+    "DatabaseDuplicateEntryError",
+    "DatabaseError",
+    "DatabaseInvalidReferenceError",
+    "DatabaseMissingRequiredError",
+    "DatabaseQueryError",
+    "DatabaseTransactionError",
+    "EntityNotFoundError",
+    "InsufficientBalanceError",
+    "InvalidFormatError",
+    "InvalidInputError",
+    "MissingRequiredFieldError",
+    "NotFoundError",
+    "OAuthProviderUnknownError",
+    "OperationNotAllowedError",
+    "RefreshTokenReuseDetectedError",
+    "ResourceNotFoundError",
+    "SessionExpiredError",
+    "UserNotFoundError",
+    "ValidationError",
 )
 
+# Public name -> module that defines it; imported on first attribute access
+_LAZY: Dict[str, str] = {
+    **{name: ".core.exceptions" for name in _CORE_EXCEPTIONS},
+    "ErrorAnalyzer": ".analysis",
+    "analyze_errors": ".analysis",
+    "openapi_errors": ".analysis",
+    "BackendError": ".client",
+    "ErrorResponseParser": ".client",
+    "PydanticErrorConverter": ".converters",
+    "PythonErrorConverter": ".converters",
+    "SQLErrorConverter": ".converters",
+    "UniversalErrorConverter": ".converters",
+    "ErrorCode": ".core.error_codes",
+    "ErrorDetail": ".core.error_response",
+    "ErrorResponse": ".core.error_response",
+    "ErrorResponseRenderer": ".core.renderers",
+    "ErrorTranslator": ".i18n.translator",
+    "apply_api_errors": ".litestar_utils",
+    "errors": ".litestar_utils",
+    "raises_from": ".litestar_utils",
+    "apply_litestar_openapi_problem_details": ".middleware.litestar",
+    "create_litestar_exception_handlers": ".middleware.litestar",
+}
+
+# WebSocket helpers need FastAPI; they resolve to ``None`` when it is missing
+_WEBSOCKET_NAMES = (
+    "WebSocketError",
+    "JSONRPCErrorCode",
+    "WebSocketAuthError",
+    "WebSocketTokenExpiredError",
+    "WebSocketRateLimitError",
+    "WebSocketValidationError",
+    "WebSocketMethodNotFoundError",
+    "WebSocketInternalError",
+    "WebSocketErrorHandler",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    elif name in _WEBSOCKET_NAMES:
+        try:
+            websocket = importlib.import_module(".websocket", __name__)
+        except ImportError:  # pragma: no cover - optional dependency
+            value = None
+        else:
+            value = getattr(websocket, name, None)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def _load_optional(module: str, name: str) -> Callable[..., Any] | None:
+    """Import ``name`` from an optional-dependency module, if available."""
+    try:
+        return getattr(importlib.import_module(module, __name__), name)
+    except ImportError:
+        return None
+
 
 def setup_error_handling(
     app: Any,
@@ -117,6 +183,7 @@ def setup_error_handling(
         [AppError, str | None, ErrorTranslator | None], str
     ] | None = None,
 ) -> Any:
+    _setup_error_handling = _load_optional(".middleware.fastapi", "setup_error_handling")
     if _setup_error_handling is None:
         raise ImportError(
             "Install 'awesome-errors[fastapi]' to enable FastAPI middleware integration."
@@ -137,24 +204,43 @@ def setup_error_handling(
 
 
 def setup_automatic_error_docs(app: Any, **kwargs: Any) -> Any:
+    _setup_automatic_error_docs = _load_optional(
+        ".integrations.fastapi_auto_docs", "setup_automatic_error_docs"
+    )
     if _setup_automatic_error_docs is None:
         raise ImportError("FastAPI integration requires fastapi to be installed")
     return _setup_automatic_error_docs(app, **kwargs)
 
 
 def apply_auto_error_docs_to_router(router: Any, **kwargs: Any) -> Any:
+    _apply_auto_error_docs_to_router = _load_optional(
+        ".integrations.fastapi_auto_docs", "apply_auto_error_docs_to_router"
+    )
     if _apply_auto_error_docs_to_router is None:
         raise ImportError("FastAPI integration requires fastapi to be installed")
     return _apply_auto_error_docs_to_router(router, **kwargs)
 
 
 def auto_analyze_errors(func: Any) -> Any:
+    _auto_analyze_errors = _load_optional(
+        ".integrations.fastapi_auto_docs", "auto_analyze_errors"
+    )
     if _auto_analyze_errors is None:
         raise ImportError("FastAPI integration requires fastapi to be installed")
     return _auto_analyze_errors(func)
 
 
+def error_route(app: Any, method: str, path: str, **kwargs: Any) -> Any:
+    _error_route = _load_optional(".integrations.fastapi_auto_docs", "error_route")
+    if _error_route is None:
+        raise ImportError("FastAPI integration requires fastapi to be installed")
+    return _error_route(app, method, path, **kwargs)
+
+
 def setup_websocket_error_handling(app: Any) -> Any:
+    _setup_websocket_error_handling = _load_optional(
+        ".websocket", "setup_websocket_error_handling"
+    )
     if _setup_websocket_error_handling is None:
         raise ImportError(
             "Install 'awesome-errors[fastapi]' to enable WebSocket error handling."
@@ -219,6 +305,7 @@ __all__ = [
     "setup_automatic_error_docs",
     "apply_auto_error_docs_to_router",
     "auto_analyze_errors",
+    "error_route",
     "WebSocketError",
     "JSONRPCErrorCode",
     "WebSocketAuthError",
@@ -0,0 +1,82 @@
+"""Opt-in on-disk cache for decorator error analysis results.
+
+Enabled by setting ``AWESOME_ERRORS_CACHE_DIR`` to a directory (or to ``1``
+for ``~/.cache/awesome_errors``). Entries are keyed by a hash of the
+function's source, so edited functions are re-analyzed automatically.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+CACHE_DIR_ENV = "AWESOME_ERRORS_CACHE_DIR"
+
+# Bump when the analysis result format or analyzer behaviour changes
+_FORMAT_VERSION = "1"
+
+
+def cache_dir() -> Optional[Path]:
+    """Return the configured cache directory, or ``None`` when disabled."""
+    value = os.environ.get(CACHE_DIR_ENV, "").strip()
+    if not value or value.lower() in ("0", "false", "no"):
+        return None
+    if value.lower() in ("1", "true", "yes"):
+        return Path.home() / ".cache" / "awesome_errors"
+    return Path(value).expanduser()
+
+
+def source_key(func: Callable) -> Optional[str]:
+    """Hash the source and identity of ``func`` into a cache key."""
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        return None
+
+    code = getattr(inspect.unwrap(func), "__code__", None)
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        _FORMAT_VERSION,
+        getattr(func, "__module__", None) or "",
+        getattr(func, "__qualname__", ""),
+        str(getattr(code, "co_firstlineno", 0)),
+        source,
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load(key: str) -> Optional[Dict[str, Any]]:
+    """Load a cached analysis result, if present."""
+    directory = cache_dir()
+    if directory is None:
+        return None
+    try:
+        with open(directory / f"{key}.json", "rb") as f:
+            data = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def save(key: str, data: Dict[str, Any]) -> None:
+    """Persist an analysis result; failures are silently ignored."""
+    directory = cache_dir()
+    if directory is None:
+        return
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, directory / f"{key}.json")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError):
+        pass
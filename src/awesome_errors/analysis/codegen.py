@@ -0,0 +1,65 @@
+"""Precompute decorator error analysis into the on-disk cache.
+
+Run at build time so deployed processes load analysis results instead of
+parsing source on start-up::
+
+    python -m awesome_errors.analysis.codegen myapp.api myapp.admin \\
+        --cache-dir .awesome_errors_cache
+
+Ship the cache directory with the application and point
+``AWESOME_ERRORS_CACHE_DIR`` at it in production.
+"""
+
+import argparse
+import importlib
+import os
+from typing import Iterable, List, Optional
+
+from . import _cache
+from . import decorators
+
+
+def warm_cache(modules: Iterable[str]) -> int:
+    """
+    Import ``modules`` so their decorators write results to the disk cache.
+
+    Args:
+        modules: Dotted names of the modules defining decorated endpoints
+
+    Returns:
+        Number of decorated functions whose analysis is now cached
+    """
+    if _cache.cache_dir() is None:
+        raise RuntimeError(f"{_cache.CACHE_DIR_ENV} is not set")
+
+    before = len(decorators._ANALYSIS_CACHE)
+    for name in modules:
+        importlib.import_module(name)
+    return len(decorators._ANALYSIS_CACHE) - before
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m awesome_errors.analysis.codegen",
+        description="Precompute error analysis for decorated endpoints.",
+    )
+    parser.add_argument("modules", nargs="+", help="modules to import")
+    parser.add_argument(
+        "--cache-dir",
+        help=f"cache directory (defaults to ${_cache.CACHE_DIR_ENV})",
+    )
+    args = parser.parse_args(argv)
+
+    if args.cache_dir:
+        os.environ[_cache.CACHE_DIR_ENV] = args.cache_dir
+    if _cache.cache_dir() is None:
+        parser.error(f"pass --cache-dir or set {_cache.CACHE_DIR_ENV}")
+
+    count = warm_cache(args.modules)
+    print(f"Cached error analysis for {count} functions in {_cache.cache_dir()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
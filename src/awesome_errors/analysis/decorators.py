@@ -1,8 +1,77 @@
-import functools
-from typing import Any, Callable, Dict, List, Optional, Set, cast
-from ..analysis.error_analyzer import ErrorAnalyzer
+import copy
+import inspect
+import sys
+from collections import defaultdict
+from types import CodeType
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set, cast
+from ..analysis import _cache
+from ..analysis.error_analyzer import ErrorAnalyzer, _analyze_from_module
 from ..core.error_codes import ErrorCode, ERROR_HTTP_STATUS_MAP
 
+# Analysis results keyed by code object; code objects are immutable and unique
+# per definition, so stacked decorators never analyze the same function twice.
+_ANALYSIS_CACHE: Dict[CodeType, Dict[str, Any]] = {}
+
+# Response description per HTTP status code
+_STATUS_DESCRIPTIONS: Dict[int, str] = {
+    400: "Bad Request - Validation or input errors",
+    401: "Unauthorized - Authentication required",
+    403: "Forbidden - Insufficient permissions",
+    404: "Not Found - Resource not found",
+    409: "Conflict - Resource conflict (e.g., duplicate entry)",
+    422: "Unprocessable Entity - Business logic errors",
+    500: "Internal Server Error - Server errors",
+}
+
+# Example description per error code when no custom description is given
+_DEFAULT_ERROR_DESCRIPTIONS: Dict[str, str] = {
+    "VALIDATION_FAILED": "Request validation failed",
+    "USER_NOT_FOUND": "User not found",
+    "AUTH_REQUIRED": "Authentication required",
+    "AUTH_PERMISSION_DENIED": "Permission denied",
+    "DB_DUPLICATE_ENTRY": "Duplicate entry in database",
+    "BUSINESS_RULE_VIOLATION": "Business rule violated",
+}
+
+
+def _cached_analyze(func: Callable) -> Dict[str, Any]:
+    """Run ``ErrorAnalyzer`` on ``func`` once and reuse the result.
+
+    Results are memoized per code object and, when ``AWESOME_ERRORS_CACHE_DIR``
+    is set, persisted on disk so later process starts skip AST parsing. Fresh
+    analyses come from a single pass over the defining module, so every
+    decorated function in a file shares one parse and walk.
+    """
+    code = getattr(inspect.unwrap(func), "__code__", None)
+    if code is None:
+        return ErrorAnalyzer(func).analyze()
+
+    analysis = _ANALYSIS_CACHE.get(code)
+    if analysis is None:
+        key = _cache.source_key(func) if _cache.cache_dir() is not None else None
+        analysis = _cache.load(key) if key else None
+        if analysis is None:
+            analysis = _analyze_from_module(func)
+            if analysis is None:
+                analysis = ErrorAnalyzer(func).analyze()
+            if key:
+                _cache.save(key, analysis)
+        _ANALYSIS_CACHE[code] = analysis
+    # Callers receive lists they may mutate; keep the cached result intact
+    return copy.deepcopy(analysis)
+
+
+def _init_markers(func: Callable) -> None:
+    """Give ``func`` every decorator marker attribute, keeping existing values.
+
+    Consumers can then test ``func._error_analysis is not None`` instead of
+    probing with ``hasattr``.
+    """
+    attrs = func.__dict__
+    attrs.setdefault("_error_analysis", None)
+    attrs.setdefault("_openapi_error_responses", None)
+    attrs.setdefault("_auto_openapi", False)
+
 
 def analyze_errors(include_dependencies: bool = True):
     """
@@ -17,20 +86,13 @@ def analyze_errors(include_dependencies: bool = True):
 
     def decorator(func: Callable) -> Callable:
         # Perform analysis
-        analyzer = ErrorAnalyzer(func)
-        analysis = analyzer.analyze()
+        analysis = _cached_analyze(func)
 
-        # Attach analysis to function
+        # Attach analysis to the function itself; no wrapper is needed
         setattr(func, "_error_analysis", analysis)
+        _init_markers(func)
 
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-
-        # Copy analysis to wrapper
-        setattr(wrapper, "_error_analysis", analysis)
-
-        return wrapper
+        return func
 
     return decorator
 
@@ -43,49 +105,46 @@ def openapi_errors(
     """
     Decorator to generate OpenAPI error responses for a function.
 
+    Also attaches the same analysis ``@analyze_errors`` would, from a single
+    analyzer run, so stacking both decorators is unnecessary.
+
     Args:
         additional_errors: Additional error codes to include
         exclude_errors: Error codes to exclude from analysis
         custom_descriptions: Custom descriptions for error codes
 
     Returns:
-        Decorated function with OpenAPI responses attached
+        Decorated function with analysis and OpenAPI responses attached
     """
 
+    # Normalize options once per decorator instead of per decorated function
+    additional = tuple(sys.intern(code) for code in additional_errors or ())
+    excluded = frozenset(sys.intern(code) for code in exclude_errors or ())
+    descriptions = {
+        sys.intern(code): description
+        for code, description in (custom_descriptions or {}).items()
+    }
+
     def decorator(func: Callable) -> Callable:
         # Analyze function for errors
-        analyzer = ErrorAnalyzer(func)
-        analysis = analyzer.analyze()
-
-        # Get all error codes
-        error_codes = set(analysis["error_codes"])
+        analysis = _cached_analyze(func)
 
-        # Add additional errors
-        if additional_errors:
-            error_codes.update(additional_errors)
-
-        # Remove excluded errors
-        if exclude_errors:
-            error_codes -= set(exclude_errors)
+        # Get all error codes, adding additional and removing excluded errors
+        error_codes = {
+            code
+            for code in (*analysis["error_codes"], *additional)
+            if code not in excluded
+        }
 
         # Generate OpenAPI responses
-        openapi_responses = _generate_openapi_responses(
-            error_codes, custom_descriptions or {}
-        )
+        openapi_responses = _generate_openapi_responses(error_codes, descriptions)
 
-        # Attach to function
+        # Attach to the function itself; no wrapper is needed
         setattr(func, "_openapi_error_responses", openapi_responses)
         setattr(func, "_error_analysis", analysis)
+        _init_markers(func)
 
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-
-        # Copy to wrapper
-        setattr(wrapper, "_openapi_error_responses", openapi_responses)
-        setattr(wrapper, "_error_analysis", analysis)
-
-        return wrapper
+        return func
 
     return decorator
 
@@ -97,18 +156,17 @@ def _generate_openapi_responses(
     responses = {}
 
     # Group errors by HTTP status code
-    status_groups: Dict[int, List[str]] = {}
+    status_groups: DefaultDict[int, List[str]] = defaultdict(list)
+    known_codes = ErrorCode._value2member_map_
+    status_for = ERROR_HTTP_STATUS_MAP.get
 
     for error_code in error_codes:
-        try:
-            error_enum = ErrorCode(error_code)
-            status_code = ERROR_HTTP_STATUS_MAP.get(error_enum, 500)
-        except ValueError:
-            # Unknown error code
+        member = known_codes.get(error_code)
+        if member is None:
+            # Unknown (custom) error codes are documented as server errors
             status_code = 500
-
-        if status_code not in status_groups:
-            status_groups[status_code] = []
+        else:
+            status_code = status_for(cast(ErrorCode, member), 500)
         status_groups[status_code].append(error_code)
 
     # Generate response for each status code
@@ -168,17 +226,7 @@ def _generate_openapi_responses(
 
 def _get_status_description(status_code: int, error_codes: List[str]) -> str:
     """Get description for HTTP status code."""
-    status_descriptions = {
-        400: "Bad Request - Validation or input errors",
-        401: "Unauthorized - Authentication required",
-        403: "Forbidden - Insufficient permissions",
-        404: "Not Found - Resource not found",
-        409: "Conflict - Resource conflict (e.g., duplicate entry)",
-        422: "Unprocessable Entity - Business logic errors",
-        500: "Internal Server Error - Server errors",
-    }
-
-    base_desc = status_descriptions.get(status_code, f"HTTP {status_code}")
+    base_desc = _STATUS_DESCRIPTIONS.get(status_code, f"HTTP {status_code}")
     codes_str = ", ".join(error_codes)
 
     return f"{base_desc}. Possible error codes: {codes_str}"
@@ -192,9 +240,9 @@ def _generate_examples(
 
     for error_code in error_codes:
         example_name = error_code.lower().replace("_", "-")
-        description = custom_descriptions.get(
-            error_code, _get_default_error_description(error_code)
-        )
+        description = custom_descriptions.get(error_code)
+        if description is None:
+            description = _get_default_error_description(error_code)
 
         examples[example_name] = {
             "summary": f"{error_code} example",
@@ -215,16 +263,7 @@ def _generate_examples(
 
 def _get_default_error_description(error_code: str) -> str:
     """Get default description for error code."""
-    descriptions = {
-        "VALIDATION_FAILED": "Request validation failed",
-        "USER_NOT_FOUND": "User not found",
-        "AUTH_REQUIRED": "Authentication required",
-        "AUTH_PERMISSION_DENIED": "Permission denied",
-        "DB_DUPLICATE_ENTRY": "Duplicate entry in database",
-        "BUSINESS_RULE_VIOLATION": "Business rule violated",
-    }
-
-    return descriptions.get(error_code, f"Error: {error_code}")
+    return _DEFAULT_ERROR_DESCRIPTIONS.get(error_code, f"Error: {error_code}")
 
 
 def _get_example_details(error_code: str) -> Dict[str, Any]:
@@ -1,19 +1,231 @@
 import ast
+import copy
+import functools
 import inspect
-from typing import Set, List, Dict, Any, Optional, Callable
+import os
+import re
+import textwrap
+from types import ModuleType
+from typing import Set, List, Dict, Any, Optional, Callable, Tuple, Type
+
+from ..core.exceptions import AppError
+
+
+def _iter_subclasses(cls: Type[AppError]) -> List[Type[AppError]]:
+    """Return all subclasses of ``cls`` recursively."""
+    result: List[Type[AppError]] = []
+    stack = list(cls.__subclasses__())
+    while stack:
+        subclass = stack.pop()
+        result.append(subclass)
+        stack.extend(subclass.__subclasses__())
+    return result
+
+
+def _build_default_error_codes() -> Dict[str, str]:
+    """Map built-in exception class names to their default error codes."""
+    codes = {"AppError": "INTERNAL_ERROR", "HTTPException": "HTTP_EXCEPTION"}
+    for cls in _iter_subclasses(AppError):
+        error_code = getattr(cls, "error_code", None)
+        if cls.__module__ == AppError.__module__ and error_code is not None:
+            codes[cls.__name__] = str(error_code)
+    return codes
+
+
+# Exception class name -> default error code, computed once at import
+_DEFAULT_ERROR_CODES: Dict[str, str] = _build_default_error_codes()
+
+# HTTPException status code -> error code used when documenting raises
+_STATUS_ERROR_CODES: Dict[int, str] = {
+    400: "VALIDATION_FAILED",
+    401: "AUTH_REQUIRED",
+    403: "AUTH_PERMISSION_DENIED",
+    404: "RESOURCE_NOT_FOUND",
+    409: "RESOURCE_CONFLICT",
+    422: "BUSINESS_RULE_VIOLATION",
+    500: "INTERNAL_ERROR",
+}
+
+# Source files whose parsed trees stay cached. Keys include the file's mtime,
+# so edited files are re-parsed and stale trees age out instead of piling up.
+_SOURCE_CACHE_SIZE = 32
+
+# Method names hinting at database or validation errors
+_SQLALCHEMY_METHODS = frozenset(
+    {"execute", "commit", "rollback", "query", "add", "delete", "merge", "flush"}
+)
+_PYDANTIC_METHODS = frozenset(
+    {"model_validate", "parse_obj", "model_dump", "model_validate_json"}
+)
+
+# Decorator name as written after ``@``, e.g. ``app.get`` in ``@app.get("/")``
+_DECORATOR_NAME_RE = re.compile(r"@\s*([\w.]+)")
+
+# Common decorators and the errors they may raise
+_DECORATOR_ERRORS: Dict[str, Tuple[str, ...]] = {
+    "require_auth": ("AUTH_REQUIRED", "AUTH_PERMISSION_DENIED"),
+    "validate_input": ("VALIDATION_FAILED", "INVALID_INPUT"),
+    "rate_limit": ("RATE_LIMIT_EXCEEDED",),
+    "cache": ("CACHE_ERROR",),
+}
+
+
+def _has_session_receiver(node: ast.AST) -> bool:
+    """Check whether an attribute chain goes through a ``*session`` object."""
+    while type(node) is ast.Attribute:
+        if node.attr.endswith("session"):  # type: ignore[attr-defined]
+            return True
+        node = node.value  # type: ignore[attr-defined]
+    return type(node) is ast.Name and node.id.endswith("session")  # type: ignore[attr-defined]
+
+
+@functools.lru_cache(maxsize=None)
+def _sqlalchemy_error_codes() -> frozenset:
+    """Return every error code the SQL converter can produce, computed once."""
+    # Imported lazily so the analyzer does not pull in SQLAlchemy up front
+    from ..converters.sql_converter import SQLErrorConverter
+    from ..core.error_codes import ErrorCode
+
+    codes = {code.value for _, code, _ in SQLErrorConverter.SQL_PATTERNS}
+    codes.update(
+        [
+            ErrorCode.DB_CONNECTION_ERROR.value,
+            ErrorCode.DB_QUERY_ERROR.value,
+            ErrorCode.DB_TRANSACTION_ERROR.value,
+        ]
+    )
+    return frozenset(codes)
+
+
+@functools.lru_cache(maxsize=_SOURCE_CACHE_SIZE)
+def _parse_source_cached(path: str, mtime: float) -> ast.Module:
+    """Parse a source file once per modification time."""
+    with open(path, "rb") as f:
+        return ast.parse(f.read(), filename=path)
+
+
+@functools.lru_cache(maxsize=_SOURCE_CACHE_SIZE)
+def _function_nodes_cached(path: str, mtime: float) -> Dict[Tuple[str, int], ast.AST]:
+    """Index function definitions of a source file by ``(name, first line)``."""
+    nodes: Dict[Tuple[str, int], ast.AST] = {}
+    for node in ast.walk(_parse_source_cached(path, mtime)):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            nodes[(node.name, _first_line(node))] = node
+    return nodes
+
+
+def _first_line(node: ast.AST) -> int:
+    """Return the line ``co_firstlineno`` reports for a function definition."""
+    # ``co_firstlineno`` points at the first decorator when present
+    return min([node.lineno] + [d.lineno for d in node.decorator_list])  # type: ignore[attr-defined]
+
+
+def _iter_function_defs(tree: ast.AST) -> List[Tuple[str, ast.AST]]:
+    """Return ``(qualname, node)`` for every function definition in ``tree``."""
+    functions: List[Tuple[str, ast.AST]] = []
+    stack: List[Tuple[ast.AST, str]] = [(tree, "")]
+    while stack:
+        node, prefix = stack.pop()
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                qualname = prefix + child.name
+                functions.append((qualname, child))
+                stack.append((child, qualname + ".<locals>."))
+            elif isinstance(child, ast.ClassDef):
+                stack.append((child, prefix + child.name + "."))
+            else:
+                stack.append((child, prefix))
+    return functions
+
+
+# Holds results for every function in the file, decorated or not, so it is
+# bounded like the parse caches it is built from
+@functools.lru_cache(maxsize=_SOURCE_CACHE_SIZE)
+def _analyze_source_cached(
+    path: str, mtime: float, max_depth: int, analyze_decorators: bool
+) -> Dict[Tuple[str, int], Dict[str, Any]]:
+    """Analyze every function of a source file, keyed by ``(qualname, first line)``."""
+    # Node-based analysis has no single target function
+    analyzer = ErrorAnalyzer(None, max_depth, analyze_decorators)
+    return {
+        (qualname, _first_line(node)): analyzer._analyze_node(node)
+        for qualname, node in _iter_function_defs(_parse_source_cached(path, mtime))
+    }
+
+
+def _analyze_source(
+    obj: Any, max_depth: int = 10, analyze_decorators: bool = True
+) -> Dict[Tuple[str, int], Dict[str, Any]]:
+    """Return the single-pass analysis of the file defining ``obj``."""
+    try:
+        path = inspect.getsourcefile(obj)
+        if not path:
+            return {}
+        return _analyze_source_cached(
+            path, os.path.getmtime(path), max_depth, analyze_decorators
+        )
+    except (OSError, SyntaxError, TypeError, ValueError):
+        return {}
+
+
+def _analyze_from_module(
+    func: Callable, max_depth: int = 10, analyze_decorators: bool = True
+) -> Optional[Dict[str, Any]]:
+    """Look up ``func`` in the single-pass analysis of its source file.
+
+    Returns ``None`` when the function cannot be matched to a definition,
+    e.g. for lambdas or functions whose source has changed since import.
+    """
+    target = inspect.unwrap(func)
+    target = getattr(target, "__func__", target)
+    code = getattr(target, "__code__", None)
+    qualname = getattr(target, "__qualname__", None)
+    if code is None or qualname is None:
+        return None
+
+    results = _analyze_source(target, max_depth, analyze_decorators)
+    return results.get((qualname, code.co_firstlineno))
+
+
+def _load_function_tree(func: Callable) -> ast.AST:
+    """Return the AST of ``func``, reusing parsed source files when possible."""
+    target = inspect.unwrap(func)
+    target = getattr(target, "__func__", target)
+    code = getattr(target, "__code__", None)
+    tree: Optional[ast.AST] = None
+
+    if code is not None:
+        path = inspect.getsourcefile(target)
+        if path:
+            try:
+                nodes = _function_nodes_cached(path, os.path.getmtime(path))
+            except (OSError, SyntaxError, ValueError):
+                nodes = {}
+            tree = nodes.get((code.co_name, code.co_firstlineno))
+
+    if tree is None:
+        # Fall back to parsing the function source on its own
+        source = textwrap.dedent(inspect.getsource(func))
+        tree = ast.parse(source)
+
+    return tree
 
 
 class ErrorAnalyzer(ast.NodeVisitor):
     """AST analyzer to find all possible errors in a function."""
 
     def __init__(
-        self, function: Callable, max_depth: int = 10, analyze_decorators: bool = True
+        self,
+        function: Optional[Callable],
+        max_depth: int = 10,
+        analyze_decorators: bool = True,
     ):
         """
         Initialize error analyzer.
 
         Args:
-            function: Function to analyze
+            function: Function to analyze; ``None`` for an analyzer that only
+                walks function nodes from a parsed module
             max_depth: Maximum depth for recursive analysis
             analyze_decorators: Whether to analyze decorators
         """
@@ -23,7 +235,7 @@ class ErrorAnalyzer(ast.NodeVisitor):
         self.current_depth = 0
         self.errors: Set[str] = set()
         self.error_details: List[Dict[str, Any]] = []
-        self.visited_functions: Set[str] = set()
+        self.visited_functions: Set[Tuple[str, str]] = set()
         self.decorator_errors: List[Dict[str, Any]] = []
 
     def analyze(self) -> Dict[str, Any]:
@@ -33,36 +245,83 @@ class ErrorAnalyzer(ast.NodeVisitor):
         Returns:
             Dictionary with error analysis results
         """
-        # Reset state
+        function = self.function
+        if function is None:
+            raise ValueError("ErrorAnalyzer has no target function to analyze")
+
+        self._reset()
+
+        # Analyze decorators first
+        if self.analyze_decorators:
+            self._analyze_decorators(function)
+
+        # Analyze the main function
+        self._analyze_function(function, is_main=True)
+
+        return self._build_result(function.__name__)
+
+    @classmethod
+    def analyze_module(
+        cls, module: ModuleType, max_depth: int = 10, analyze_decorators: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze every function defined in a module in a single pass.
+
+        The module source is parsed once and each function definition,
+        including methods and nested functions, is analyzed from that tree.
+
+        Args:
+            module: Module to analyze
+            max_depth: Maximum depth for recursive analysis
+            analyze_decorators: Whether to analyze decorators
+
+        Returns:
+            Dictionary mapping function qualified names to analysis results
+        """
+        results = _analyze_source(module, max_depth, analyze_decorators)
+        return {
+            qualname: copy.deepcopy(result) for (qualname, _), result in results.items()
+        }
+
+    def _reset(self) -> None:
+        """Reset per-analysis state."""
         self.errors.clear()
         self.error_details.clear()
         self.visited_functions.clear()
         self.decorator_errors.clear()
         self.current_depth = 0
 
-        # Analyze decorators first
+    def _analyze_node(self, node: ast.AST) -> Dict[str, Any]:
+        """Analyze a function definition node taken from a parsed module."""
+        self._reset()
+
         if self.analyze_decorators:
-            self._analyze_decorators(self.function)
+            for decorator in node.decorator_list:  # type: ignore[attr-defined]
+                self._analyze_decorator_line(f"@{ast.unparse(decorator)}")
 
-        # Analyze the main function
-        self._analyze_function(self.function, is_main=True)
+        self.visit(node)
 
+        return self._build_result(node.name)  # type: ignore[attr-defined]
+
+    def _build_result(self, function_name: str) -> Dict[str, Any]:
+        """Build the analysis result from the collected state."""
         return {
-            "function_name": self.function.__name__,
+            "function_name": function_name,
             "error_codes": sorted(list(self.errors)),
-            "error_details": self.error_details,
-            "decorator_errors": self.decorator_errors,
+            "error_details": list(self.error_details),
+            "decorator_errors": list(self.decorator_errors),
             "total_errors": len(self.errors),
             "analysis_depth": self.current_depth,
             "max_depth_reached": self.current_depth >= self.max_depth,
         }
 
     def _analyze_function(self, func: Callable, is_main: bool = False) -> None:
-        """Analyze a specific function for errors with depth control."""
-        if self.current_depth >= self.max_depth and not is_main:
-            return
+        """Analyze a specific function for errors with depth control.
 
-        func_name = f"{func.__module__}.{func.__qualname__}"
+        Callers check ``current_depth < max_depth`` before resolving a call,
+        so nested functions past the depth limit never reach this method.
+        """
+        func_name = (func.__module__, func.__qualname__)
 
         # Avoid infinite recursion
         if func_name in self.visited_functions:
@@ -74,13 +333,8 @@ class ErrorAnalyzer(ast.NodeVisitor):
             self.current_depth += 1
 
         try:
-            # Get function source and parse AST
-            source = inspect.getsource(func)
-            # Remove leading indentation to avoid IndentationError
-            import textwrap
-
-            source = textwrap.dedent(source)
-            tree = ast.parse(source)
+            # Get function AST (source files are parsed once and cached)
+            tree = _load_function_tree(func)
 
             # Visit AST nodes
             self.visit(tree)
@@ -92,6 +346,42 @@ class ErrorAnalyzer(ast.NodeVisitor):
         if not is_main:
             self.current_depth -= 1
 
+    def visit(self, node: ast.AST) -> None:
+        """Walk the tree iteratively, dispatching ``Raise`` and ``Call`` nodes.
+
+        Uses an explicit stack instead of recursive ``generic_visit`` calls;
+        children are pushed in reverse so nodes are handled in source order.
+        """
+        stack: List[ast.AST] = [node]
+        pop = stack.pop
+        ast_node = ast.AST
+        raise_type = ast.Raise
+        call_type = ast.Call
+        handle_raise = self.visit_Raise
+        handle_call = self.visit_Call
+
+        while stack:
+            current = pop()
+            node_type = type(current)
+            if node_type is raise_type:
+                handle_raise(current)  # type: ignore[arg-type]
+            elif node_type is call_type:
+                handle_call(current)  # type: ignore[arg-type]
+
+            children: List[ast.AST] = []
+            add_child = children.append
+            for field in current._fields:
+                value = getattr(current, field, None)
+                if type(value) is list:
+                    for child in value:
+                        if isinstance(child, ast_node):
+                            add_child(child)
+                elif isinstance(value, ast_node):
+                    add_child(value)
+            if children:
+                children.reverse()
+                stack.extend(children)
+
     def visit_Raise(self, node: ast.Raise) -> None:
         """Handle raise statements."""
         if node.exc:
@@ -100,13 +390,15 @@ class ErrorAnalyzer(ast.NodeVisitor):
                 self.errors.add(error_info["code"])
                 self.error_details.append(error_info)
 
-        self.generic_visit(node)
-
     def visit_Call(self, node: ast.Call) -> None:
         """Enhanced call analysis with context-aware error detection."""
         # Analyze call context for known error patterns
         self._analyze_call_context(node)
 
+        # Nothing below the depth limit gets resolved or loaded
+        if self.current_depth >= self.max_depth:
+            return
+
         # Handle method calls (obj.method())
         if isinstance(node.func, ast.Attribute):
             self._analyze_method_call(node)
@@ -114,76 +406,36 @@ class ErrorAnalyzer(ast.NodeVisitor):
         # Handle regular function calls
         else:
             called_func = self._resolve_function_call(node)
-            if called_func and self.current_depth < self.max_depth:
+            if called_func:
                 self._analyze_function(called_func)
 
-        self.generic_visit(node)
-
     def _analyze_call_context(self, node: ast.Call) -> None:
-        """Analyze call context to detect common error patterns."""
-        call_str = self._get_call_string(node)
+        """Analyze call context to detect common error patterns.
+
+        Only ``obj.method()`` calls are of interest, so the method name and
+        the attribute chain are inspected directly instead of formatting the
+        call as a string.
+        """
+        func = node.func
+        if type(func) is not ast.Attribute:
+            return
 
         # SQLAlchemy session operations
-        if any(
-            pattern in call_str
-            for pattern in [
-                "session.",
-                ".execute(",
-                ".commit(",
-                ".rollback(",
-                ".query(",
-                ".add(",
-                ".delete(",
-                ".merge(",
-                ".flush(",
-            ]
-        ):
+        method = func.attr
+        if method in _SQLALCHEMY_METHODS or _has_session_receiver(func.value):
             self._add_sqlalchemy_errors()
 
         # Pydantic validation
-        elif any(
-            pattern in call_str
-            for pattern in [
-                ".model_validate(",
-                ".parse_obj(",
-                ".model_dump(",
-                ".model_validate_json(",
-            ]
-        ):
+        elif method in _PYDANTIC_METHODS:
             self.errors.add("VALIDATION_FAILED")
 
-        # Async operations
-        elif "await " in call_str:
-            self.errors.update(["INTERNAL_ERROR", "TIMEOUT_ERROR"])
-
-    def _get_call_string(self, node: ast.Call) -> str:
-        """Get string representation of call for pattern matching."""
-        try:
-            if isinstance(node.func, ast.Attribute):
-                return f"{self._get_attr_chain(node.func)}()"
-            elif isinstance(node.func, ast.Name):
-                return f"{node.func.id}()"
-        except Exception:
-            pass
-        return ""
-
-    def _get_attr_chain(self, node: ast.Attribute) -> str:
-        """Get full attribute chain like 'obj.method'."""
-        parts = []
-        current: ast.AST = node
-
-        while isinstance(current, ast.Attribute):
-            parts.append(current.attr)
-            current = current.value
-
-        if isinstance(current, ast.Name):
-            parts.append(current.id)
-
-        return ".".join(reversed(parts)) if parts else ""
-
     def _extract_error_info(self, node: ast.AST) -> Optional[Dict[str, Any]]:
-        """Extract error information from raise statement."""
-        if isinstance(node, ast.Call):
+        """Extract error information from raise statement.
+
+        AST node classes are never subclassed, so the raise-extraction helpers
+        compare ``type()`` identity instead of walking the MRO via ``isinstance``.
+        """
+        if type(node) is ast.Call:
             # Handle: raise SomeError("message", code="ERROR_CODE")
             func_name = self._get_function_name(node.func)
 
@@ -200,7 +452,7 @@ class ErrorAnalyzer(ast.NodeVisitor):
                     }
                 return error_info
 
-        elif isinstance(node, ast.Name):
+        elif type(node) is ast.Name:
             # Handle: raise existing_error
             return {
                 "type": "unknown",
@@ -216,33 +468,28 @@ class ErrorAnalyzer(ast.NodeVisitor):
         # Look for code parameter
         for keyword in node.keywords:
             if keyword.arg == "code":
+                value = keyword.value
                 # Handle string constants
-                if isinstance(keyword.value, ast.Constant) and isinstance(
-                    keyword.value.value, str
-                ):
-                    return keyword.value.value
+                if type(value) is ast.Constant:
+                    if type(value.value) is str:
+                        return value.value
                 # Handle ErrorCode.CONSTANT_NAME
-                elif isinstance(keyword.value, ast.Attribute):
-                    if (
-                        isinstance(keyword.value.value, ast.Name)
-                        and keyword.value.value.id == "ErrorCode"
-                    ):
-                        return keyword.value.attr
+                elif type(value) is ast.Attribute:
+                    owner = value.value
+                    if type(owner) is ast.Name and owner.id == "ErrorCode":
+                        return value.attr
                 # Handle ErrorCode("CUSTOM_ERROR_CODE")
-                elif isinstance(keyword.value, ast.Call):
-                    if (
-                        isinstance(keyword.value.func, ast.Name)
-                        and keyword.value.func.id == "ErrorCode"
-                        and keyword.value.args
-                        and isinstance(keyword.value.args[0], ast.Constant)
-                        and isinstance(keyword.value.args[0].value, str)
-                    ):
-                        return keyword.value.args[0].value
+                elif type(value) is ast.Call:
+                    func = value.func
+                    if type(func) is ast.Name and func.id == "ErrorCode" and value.args:
+                        custom_code = self._extract_string_value(value.args[0])
+                        if custom_code is not None:
+                            return custom_code
                 return "UNKNOWN_ERROR"
 
         # Look for ErrorCode in positional args
         for arg in node.args:
-            if isinstance(arg, ast.Call):
+            if type(arg) is ast.Call:
                 func_name = self._get_function_name(arg.func)
                 if func_name == "ErrorCode" and arg.args:
                     return self._extract_string_value(arg.args[0]) or "UNKNOWN_ERROR"
@@ -267,43 +514,25 @@ class ErrorAnalyzer(ast.NodeVisitor):
 
     def _extract_string_value(self, node: ast.AST) -> Optional[str]:
         """Extract string value from AST node."""
-        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        if type(node) is ast.Constant and type(node.value) is str:
             return node.value
         return None
 
     def _get_function_name(self, node: ast.AST) -> Optional[str]:
         """Get function name from call node."""
-        if isinstance(node, ast.Name):
+        if type(node) is ast.Name:
             return node.id
-        elif isinstance(node, ast.Attribute):
+        elif type(node) is ast.Attribute:
             return node.attr
         return None
 
     def _is_app_error_class(self, name: str) -> bool:
-        """Check if name is an AppError class."""
-        app_error_classes = {
-            "AppError",
-            "ValidationError",
-            "AuthError",
-            "NotFoundError",
-            "DatabaseError",
-            "BusinessLogicError",
-            "HTTPException",  # Support FastAPI HTTPException
-        }
-        return name in app_error_classes
+        """Check if name is an AppError class (or FastAPI HTTPException)."""
+        return name in _DEFAULT_ERROR_CODES
 
     def _get_default_error_code(self, class_name: str) -> str:
         """Get default error code for exception class."""
-        default_codes = {
-            "ValidationError": "VALIDATION_FAILED",
-            "AuthError": "AUTH_REQUIRED",
-            "NotFoundError": "RESOURCE_NOT_FOUND",
-            "DatabaseError": "DB_QUERY_ERROR",
-            "BusinessLogicError": "BUSINESS_RULE_VIOLATION",
-            "AppError": "INTERNAL_ERROR",
-            "HTTPException": "HTTP_EXCEPTION",
-        }
-        return default_codes.get(class_name, "UNKNOWN_ERROR")
+        return _DEFAULT_ERROR_CODES.get(class_name, "UNKNOWN_ERROR")
 
     def _extract_http_exception_info(self, node: ast.Call) -> Dict[str, Any]:
         """Extract error information from HTTPException constructor."""
@@ -312,21 +541,20 @@ class ErrorAnalyzer(ast.NodeVisitor):
 
         # Extract status_code from kwargs or positional args
         for keyword in node.keywords:
+            value = keyword.value
+            if type(value) is not ast.Constant:
+                continue
             if keyword.arg == "status_code":
-                if isinstance(keyword.value, ast.Constant) and isinstance(
-                    keyword.value.value, int
-                ):
-                    status_code = keyword.value.value
+                if isinstance(value.value, int):
+                    status_code = value.value
             elif keyword.arg == "detail":
-                if isinstance(keyword.value, ast.Constant) and isinstance(
-                    keyword.value.value, str
-                ):
-                    message = keyword.value.value
+                if type(value.value) is str:
+                    message = value.value
 
         # Check positional args for status_code
         if (
             node.args
-            and isinstance(node.args[0], ast.Constant)
+            and type(node.args[0]) is ast.Constant
             and isinstance(node.args[0].value, int)
         ):
             status_code = node.args[0].value
@@ -344,72 +572,46 @@ class ErrorAnalyzer(ast.NodeVisitor):
 
     def _map_status_code_to_error_code(self, status_code: int) -> str:
         """Map HTTP status code to appropriate error code."""
-        status_to_error = {
-            400: "VALIDATION_FAILED",
-            401: "AUTH_REQUIRED",
-            403: "AUTH_PERMISSION_DENIED",
-            404: "RESOURCE_NOT_FOUND",
-            409: "RESOURCE_CONFLICT",
-            422: "BUSINESS_RULE_VIOLATION",
-            500: "INTERNAL_ERROR",
-        }
-        return status_to_error.get(status_code, "HTTP_EXCEPTION")
+        return _STATUS_ERROR_CODES.get(status_code, "HTTP_EXCEPTION")
 
     def _analyze_decorators(self, func: Callable) -> None:
         """Analyze function decorators for potential errors."""
         try:
             source_lines = inspect.getsourcelines(func)[0]
-
-            decorator_lines = []
-            for line in source_lines:
-                stripped = line.strip()
-                if stripped.startswith("@"):
-                    decorator_lines.append(stripped)
-                elif stripped.startswith("def "):
-                    break
-
-            for decorator_line in decorator_lines:
-                self._analyze_decorator_line(decorator_line)
-
         except (OSError, TypeError):
-            pass
+            return
+
+        for line in source_lines:
+            stripped = line.lstrip()
+            if stripped.startswith("@"):
+                self._analyze_decorator_line(stripped)
+            elif stripped.startswith(("def ", "async def ")):
+                break
 
     def _analyze_decorator_line(self, decorator_line: str) -> None:
         """Analyze a single decorator line."""
-        try:
-            decorator_name = decorator_line.replace("@", "").strip()
-
-            if "(" in decorator_name:
-                decorator_name = decorator_name.split("(")[0]
-
-            # Common decorator patterns
-            decorator_errors = {
-                "require_auth": ["AUTH_REQUIRED", "AUTH_PERMISSION_DENIED"],
-                "validate_input": ["VALIDATION_FAILED", "INVALID_INPUT"],
-                "rate_limit": ["RATE_LIMIT_EXCEEDED"],
-                "cache": ["CACHE_ERROR"],
-            }
-
-            if decorator_name in decorator_errors:
-                errors = decorator_errors[decorator_name]
-                self.errors.update(errors)
-                self.decorator_errors.append(
-                    {
-                        "decorator": decorator_name,
-                        "possible_errors": errors,
-                        "type": "decorator_analysis",
-                    }
-                )
+        match = _DECORATOR_NAME_RE.match(decorator_line)
+        if match is None:
+            return
 
-        except Exception:
-            pass
+        decorator_name = match.group(1)
+        errors = _DECORATOR_ERRORS.get(decorator_name)
+        if errors is not None:
+            self.errors.update(errors)
+            self.decorator_errors.append(
+                {
+                    "decorator": decorator_name,
+                    "possible_errors": list(errors),
+                    "type": "decorator_analysis",
+                }
+            )
 
     def _analyze_method_call(self, node: ast.Call) -> None:
         """Analyze method calls by trying to resolve and analyze the actual method."""
         if isinstance(node.func, ast.Attribute):
             # Try to resolve the actual method and analyze it
             resolved_method = self._resolve_method_call(node)
-            if resolved_method and self.current_depth < self.max_depth:
+            if resolved_method:
                 self._analyze_function(resolved_method)
 
     def _analyze_builtin_function(self, func: Callable) -> None:
@@ -431,24 +633,7 @@ class ErrorAnalyzer(ast.NodeVisitor):
 
     def _add_sqlalchemy_errors(self) -> None:
         """Add SQLAlchemy errors using existing converter knowledge."""
-        from ..converters.sql_converter import SQLErrorConverter
-        from ..core.error_codes import ErrorCode
-
-        # Get all possible error codes from SQL converter patterns
-        sql_error_codes = set()
-        for pattern, (code, message) in SQLErrorConverter.SQL_PATTERNS.items():
-            sql_error_codes.add(code.value)
-
-        # Add common SQLAlchemy errors based on existing converter
-        sql_error_codes.update(
-            [
-                ErrorCode.DB_CONNECTION_ERROR.value,
-                ErrorCode.DB_QUERY_ERROR.value,
-                ErrorCode.DB_TRANSACTION_ERROR.value,
-            ]
-        )
-
-        self.errors.update(sql_error_codes)
+        self.errors.update(_sqlalchemy_error_codes())
 
     def _resolve_method_call(self, node: ast.Call) -> Optional[Callable]:
         """Try to resolve method call to actual method object."""
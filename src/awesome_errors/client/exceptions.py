@@ -1,6 +1,22 @@
+from datetime import datetime
 from typing import Optional, Dict, Any
 from ..core.error_response import ErrorDetail
 
+_VALIDATION_CODES = frozenset(
+    {
+        "VALIDATION_FAILED",
+        "INVALID_INPUT",
+        "MISSING_REQUIRED_FIELD",
+    }
+)
+_BUSINESS_CODES = frozenset(
+    {
+        "BUSINESS_RULE_VIOLATION",
+        "INSUFFICIENT_BALANCE",
+        "OPERATION_NOT_ALLOWED",
+    }
+)
+
 
 class BackendError(Exception):
     """
@@ -23,6 +39,23 @@ class BackendError(Exception):
                 print("Invalid input")
     """
 
+    __slots__ = (
+        "error",
+        "status_code",
+        "response_headers",
+        "code",
+        "message",
+        "details",
+        "request_id",
+        "timestamp",
+    )
+
+    code: str
+    message: str
+    details: Dict[str, Any]
+    request_id: str
+    timestamp: datetime
+
     def __init__(
         self,
         error: ErrorDetail,
@@ -41,40 +74,18 @@ class BackendError(Exception):
         self.status_code = status_code
         self.response_headers = response_headers or {}
 
-        super().__init__(error.message)
-
-    @property
-    def code(self) -> str:
-        """Get error code from server response."""
-        return self.error.code
+        # Copied from the server error detail for plain attribute access
+        self.code = error.code
+        self.message = error.message
+        self.details = error.details
+        self.request_id = error.request_id
+        self.timestamp = error.timestamp
 
-    @property
-    def message(self) -> str:
-        """Get error message from server response."""
-        return self.error.message
-
-    @property
-    def details(self) -> Dict[str, Any]:
-        """Get error details from server response."""
-        return self.error.details
-
-    @property
-    def request_id(self) -> str:
-        """Get request ID for tracing."""
-        return self.error.request_id
-
-    @property
-    def timestamp(self):
-        """Get error timestamp from server."""
-        return self.error.timestamp
+        super().__init__(error.message)
 
     def is_validation_error(self) -> bool:
         """Check if this is a validation error from server."""
-        return self.code in [
-            "VALIDATION_FAILED",
-            "INVALID_INPUT",
-            "MISSING_REQUIRED_FIELD",
-        ]
+        return self.code in _VALIDATION_CODES
 
     def is_auth_error(self) -> bool:
         """Check if this is an authentication/authorization error from server."""
@@ -90,8 +101,4 @@ class BackendError(Exception):
 
     def is_business_error(self) -> bool:
         """Check if this is a business logic error from server."""
-        return self.code in [
-            "BUSINESS_RULE_VIOLATION",
-            "INSUFFICIENT_BALANCE",
-            "OPERATION_NOT_ALLOWED",
-        ]
+        return self.code in _BUSINESS_CODES
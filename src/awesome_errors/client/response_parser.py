@@ -1,41 +1,48 @@
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, Optional, Protocol, Union, cast
+from typing import Any, ClassVar, Dict, FrozenSet, Optional, Union
+
+import msgspec
 
 from .exceptions import BackendError
 from ..core.error_response import ErrorDetail, error_detail_from_mapping
 
 
-class _HasDetails(Protocol):
-    details: Dict[str, Any]
+class ErrorDetailMixin:
+    # No instance storage of its own, so slotted error classes stay slotted
+    __slots__ = ()
 
+    details: Dict[str, Any]
 
-class ErrorDetailMixin:
     @property
     def field(self) -> Any:
-        return cast(_HasDetails, self).details.get("field")
+        return self.details.get("field")
 
     @property
     def field_errors(self) -> Any:
-        return cast(_HasDetails, self).details.get("field_errors")
+        return self.details.get("field_errors")
 
     @property
     def table(self) -> Any:
-        return cast(_HasDetails, self).details.get("table")
+        return self.details.get("table")
 
     @property
     def constraint(self) -> Any:
-        return cast(_HasDetails, self).details.get("constraint")
+        return self.details.get("constraint")
 
     @property
     def duplicate_value(self) -> Any:
-        return cast(_HasDetails, self).details.get("duplicate_value")
+        return self.details.get("duplicate_value")
 
 
 class ErrorResponseParser:
     """Parser for backend error responses."""
 
+    # Members every RFC 7807 problem document produced by the server carries
+    _PROBLEM_KEYS: ClassVar[FrozenSet[str]] = frozenset(
+        ("type", "title", "status", "code")
+    )
+
     @classmethod
     def parse_response(
         cls,
@@ -57,21 +64,29 @@ class ErrorResponseParser:
         Raises:
             ValueError: If response cannot be parsed
         """
-        try:
-            data = (
-                json.loads(response_body)
-                if isinstance(response_body, (str, bytes))
-                else response_body
+        if isinstance(response_body, dict):
+            data: Any = response_body
+        else:
+            try:
+                data = msgspec.json.decode(response_body)
+            except (msgspec.DecodeError, TypeError) as e:
+                return cls._create_fallback_error(
+                    response_body, status_code, headers, e
+                )
+
+        if not isinstance(data, dict):
+            return cls._create_fallback_error(
+                response_body,
+                status_code,
+                headers,
+                ValueError("Response body is not a JSON object"),
             )
 
-            if not isinstance(data, dict):
-                raise ValueError("Response body is not a JSON object")
-
+        try:
             detail_payload: Optional[Dict[str, Any]] = None
             if cls.is_error_response(data):
-                error_block = data.get("error", {})
-                if isinstance(error_block, dict):
-                    detail_payload = dict(error_block)
+                # Not copied: the block is only read unless request_id is missing
+                detail_payload = data["error"]
             elif cls.is_problem_response(data):
                 detail_payload = cls._problem_detail_to_error_payload(data)
 
@@ -81,20 +96,23 @@ class ErrorResponseParser:
             request_id = detail_payload.get("request_id")
             if not request_id:
                 request_id = headers.get("X-Request-ID") if headers else None
-                detail_payload["request_id"] = request_id or "unknown"
+                detail_payload = {
+                    **detail_payload,
+                    "request_id": request_id or "unknown",
+                }
 
             error_detail = error_detail_from_mapping(detail_payload)
 
-            return BackendError(
-                error=error_detail,
-                status_code=status_code,
-                response_headers=headers,
-            )
-
-        except (json.JSONDecodeError, ValueError, TypeError) as e:
+        except (ValueError, TypeError) as e:
             # Fallback for non-standard error responses
             return cls._create_fallback_error(response_body, status_code, headers, e)
 
+        return BackendError(
+            error=error_detail,
+            status_code=status_code,
+            response_headers=headers,
+        )
+
     @classmethod
     def _create_fallback_error(
         cls,
@@ -121,7 +139,8 @@ class ErrorResponseParser:
             )
             details["raw_response"] = response_body
         elif isinstance(response_body, (str, bytes)):
-            message = str(response_body)[:200]  # Limit length
+            # Limit length; slice first so large bodies are never copied whole
+            message = str(response_body[:200])[:200]
             details["raw_response"] = message
 
         # Create error detail
@@ -152,9 +171,7 @@ class ErrorResponseParser:
     @classmethod
     def is_problem_response(cls, response_data: Dict[str, Any]) -> bool:
         """Check whether the payload follows RFC 7807 conventions."""
-
-        required = {"type", "title", "status", "code"}
-        return required.issubset(response_data.keys())
+        return cls._PROBLEM_KEYS.issubset(response_data)
 
     @staticmethod
     def _problem_detail_to_error_payload(data: Dict[str, Any]) -> Dict[str, Any]:
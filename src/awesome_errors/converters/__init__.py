@@ -4,7 +4,7 @@ from typing import Any
 
 from .python_converter import PythonErrorConverter
 from .sql_converter import SQLErrorConverter
-from .universal_converter import UniversalErrorConverter
+from .universal_converter import UniversalErrorConverter, register_converter
 
 PydanticErrorConverter: Any
 try:  # pragma: no cover - optional dependency
@@ -20,6 +20,8 @@ except ImportError:  # pragma: no cover
                 "Install 'awesome-errors[pydantic]' to enable Pydantic error conversions."
             )
 
+        convert_many = convert
+
     PydanticErrorConverter = _FallbackPydanticErrorConverter
 
 
@@ -28,4 +30,5 @@ __all__ = [
     "PythonErrorConverter",
     "PydanticErrorConverter",
     "UniversalErrorConverter",
+    "register_converter",
 ]
@@ -3,18 +3,22 @@ from ..core.error_codes import ErrorCode
 
 
 def generic_error_handler(error: Exception, debug: bool = False) -> AppError:
-    error_type = type(error).__name__
-    error_module = type(error).__module__
+    error_class = type(error)
+    error_type = error_class.__name__
     details: dict[str, object] = {
         "error_type": error_type,
-        "error_module": error_module,
+        "error_module": error_class.__module__,
     }
     if debug:
         details["error_str"] = str(error)
         details["error_repr"] = repr(error)
-        if hasattr(error, "__dict__"):
+        try:
+            attrs = vars(error)
+        except TypeError:
+            attrs = None
+        if attrs is not None:
             details["error_attrs"] = {
-                k: str(v) for k, v in error.__dict__.items() if not k.startswith("_")
+                k: str(v) for k, v in attrs.items() if not k.startswith("_")
             }
     return AppError(
         code=ErrorCode.INTERNAL_ERROR,
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Mapping, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
 from pydantic import ValidationError as PydanticValidationError
 
 from ..core.error_codes import ErrorCode
@@ -19,12 +19,13 @@ class PydanticErrorConverter:
         Returns:
             Application ValidationError with detailed field information
         """
-        errors = error.errors()
+        # Documentation URLs are never reported, so skip building them
+        errors = error.errors(include_url=False)
 
         # Extract first error for main message
         first_error: Mapping[str, Any] | None = errors[0] if errors else None
-        main_field = cls._get_field_path(first_error.get("loc", [])) if first_error else ""
-        main_message = first_error.get("msg", "Validation failed") if first_error else "Validation failed"
+        main_field = cls._get_field_path(first_error["loc"]) if first_error else ""
+        main_message = first_error["msg"] if first_error else "Validation failed"
 
         # Build detailed error information
         field_errors = cls._build_field_errors(errors)
@@ -45,31 +46,52 @@ class PydanticErrorConverter:
 
         return validation_error
 
+    @classmethod
+    def convert_many(
+        cls, errors: Iterable[PydanticValidationError]
+    ) -> List[ValidationError]:
+        """
+        Convert several Pydantic validation errors in one call.
+
+        Intended for batch endpoints that validate a list of items and
+        collect one error per failed item.
+
+        Args:
+            errors: Pydantic validation errors
+
+        Returns:
+            Application ValidationErrors, in the same order
+        """
+        convert = cls.convert
+        return [convert(error) for error in errors]
+
     @classmethod
     def _build_field_errors(
         cls, errors: Sequence[Mapping[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Build detailed field error information."""
-        field_errors = []
-
-        for error in errors:
-            field_path = cls._get_field_path(error.get("loc", []))
-            field_error = {
-                "field": field_path,
-                "message": error.get("msg", "Invalid value"),
-                "type": error.get("type", "unknown"),
+        """Build detailed field error information.
+
+        pydantic-core always populates ``loc``, ``msg``, ``type`` and ``input``,
+        so only the optional ``ctx`` needs a default.
+        """
+        get_field_path = cls._get_field_path
+        return [
+            {
+                "field": get_field_path(error["loc"]),
+                "message": error["msg"],
+                "type": error["type"],
                 "context": error.get("ctx", {}),
+                "input": error["input"],
             }
-
-            # Add input value if available
-            if "input" in error:
-                field_error["input"] = error["input"]
-
-            field_errors.append(field_error)
-
-        return field_errors
+            for error in errors
+        ]
 
     @classmethod
     def _get_field_path(cls, loc: Sequence[Any]) -> str:
         """Convert location list to field path string."""
-        return ".".join(str(part) for part in loc) if loc else ""
+        if not loc:
+            return ""
+        if len(loc) == 1:
+            part = loc[0]
+            return part if type(part) is str else str(part)
+        return ".".join(map(str, loc))
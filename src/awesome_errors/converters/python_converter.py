@@ -1,4 +1,5 @@
-from typing import Dict, Type, Tuple
+import functools
+from typing import Dict, Optional, Type, Tuple
 
 from ..core.error_codes import ErrorCode
 from ..core.exceptions import AppError, ValidationError, AuthError, NotFoundError
@@ -43,38 +44,57 @@ class PythonErrorConverter:
         Returns:
             AppError instance
         """
-        error_type = type(error)
-
-        # Check if we have a specific mapping
-        for exc_type, (code, default_message) in cls.EXCEPTION_MAP.items():
-            if issubclass(error_type, exc_type):
-                return cls._create_app_error(error, code, default_message)
+        # Exact types hit the map directly; subclasses walk the MRO (cached)
+        exc_type = type(error)
+        mapping = cls.EXCEPTION_MAP.get(exc_type) or cls._resolve(exc_type)
+        if mapping is not None:
+            code, default_message = mapping
+            return cls._create_app_error(error, code, default_message)
 
         # Default to internal error
         return generic_error_handler(error)
 
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _resolve(cls, exc_type: Type[BaseException]) -> Optional[Tuple[ErrorCode, str]]:
+        """Find the mapping for ``exc_type``, most specific class first.
+
+        Results are cached per exception class; call ``_resolve.cache_clear()``
+        after changing ``EXCEPTION_MAP`` at runtime.
+        """
+        exception_map = cls.EXCEPTION_MAP
+        for base in exc_type.__mro__:
+            mapping = exception_map.get(base)
+            if mapping is not None:
+                return mapping
+        return None
+
     @classmethod
     def _create_app_error(
         cls, error: Exception, code: ErrorCode, default_message: str
     ) -> AppError:
         """Create appropriate AppError subclass."""
-        message = str(error) or default_message
-        details = {"exception_type": type(error).__name__}
-
         # Add specific details based on exception type
         if isinstance(error, KeyError):
-            details["key"] = str(error).strip("'\"")
-            return NotFoundError(resource="key", resource_id=details["key"], code=code)
+            # The missing key itself, not str(error) which wraps it in quotes
+            key = str(error.args[0]) if error.args else ""
+            return NotFoundError(resource="key", resource_id=key, code=code)
 
         elif isinstance(error, FileNotFoundError):
-            details["filename"] = error.filename
             return NotFoundError(resource="file", resource_id=error.filename, code=code)
 
-        elif isinstance(error, (ValueError, TypeError, AttributeError)):
+        # Exceptions raised without arguments have an empty message anyway
+        message = (str(error) if error.args else "") or default_message
+
+        if isinstance(error, (ValueError, TypeError, AttributeError)):
             return ValidationError(message=message, code=code)
 
         elif isinstance(error, PermissionError):
             return AuthError(message=message, code=code)
 
-        # Default to AppError
-        return AppError(code=code, message=message, details=details)
+        # Default to AppError; only this path reports the exception type
+        return AppError(
+            code=code,
+            message=message,
+            details={"exception_type": type(error).__name__},
+        )
@@ -1,5 +1,5 @@
 import re
-from typing import Dict, Optional, Tuple
+from typing import ClassVar, Dict, List, Tuple, cast
 from sqlalchemy.exc import (
     IntegrityError,
     DataError,
@@ -12,54 +12,127 @@ from ..core.error_codes import ErrorCode
 from ..core.exceptions import DatabaseError
 
 
+def _combine_patterns(
+    patterns: List[Tuple[re.Pattern, ErrorCode, str]],
+) -> Tuple[re.Pattern, Dict[str, Tuple[ErrorCode, str]]]:
+    """Join ``patterns`` into one alternation with a named group per pattern."""
+    regex = "|".join(
+        f"(?P<p{index}>{pattern.pattern})"
+        for index, (pattern, _, _) in enumerate(patterns)
+    )
+    outcomes = {
+        f"p{index}": (code, message)
+        for index, (_, code, message) in enumerate(patterns)
+    }
+    return re.compile(regex), outcomes
+
+
+# Detail extractors per field, in priority order (PostgreSQL, MySQL, SQLite).
+# Each pattern captures the extracted value in its only group.
+_DETAIL_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "table": (r'relation "([^"]+)"', r"`[^`]+`\.`([^`]+)`", r"table (\w+)"),
+    "field": (r'column "([^"]+)"', r"Column '([^']+)'", r"column (\w+)"),
+    "constraint": (r'constraint "([^"]+)"', r"key '([^']+)'"),
+    "duplicate_value": (r"Key \([^)]+\)=\(([^)]+)\)", r"Duplicate entry '([^']+)'"),
+}
+
+
+def _combine_detail_patterns(
+    patterns: Dict[str, Tuple[str, ...]],
+) -> Tuple[re.Pattern, Dict[str, Tuple[str, int, int]]]:
+    """Join detail extractors into one regex scanned with a single ``finditer``.
+
+    Alternatives are zero-width lookaheads, so a match never consumes text
+    another extractor needs. Returns the regex and, per alternative group
+    name, the detail field, the pattern priority and the index of the group
+    holding the captured value.
+    """
+    alternatives = []
+    groups: Dict[str, Tuple[str, int]] = {}
+    for priority in range(max(len(options) for options in patterns.values())):
+        for field, options in patterns.items():
+            if priority < len(options):
+                name = f"{field}_{priority}"
+                alternatives.append(f"(?=(?P<{name}>{options[priority]}))")
+                groups[name] = (field, priority)
+
+    regex = re.compile("|".join(alternatives))
+    return regex, {
+        name: (field, priority, regex.groupindex[name] + 1)
+        for name, (field, priority) in groups.items()
+    }
+
+
 class SQLErrorConverter:
     """Convert SQLAlchemy errors to application errors."""
 
-    # Regex patterns for common SQL errors
-    SQL_PATTERNS: Dict[re.Pattern, Tuple[ErrorCode, str]] = {
+    # Regex patterns for common SQL errors, checked in order
+    SQL_PATTERNS: ClassVar[List[Tuple[re.Pattern, ErrorCode, str]]] = [
         # PostgreSQL patterns
-        re.compile(r"duplicate key value violates unique constraint"): (
+        (
+            re.compile(r"duplicate key value violates unique constraint"),
             ErrorCode.DB_DUPLICATE_ENTRY,
             "Record already exists",
         ),
-        re.compile(r"violates foreign key constraint"): (
+        (
+            re.compile(r"violates foreign key constraint"),
             ErrorCode.DB_INVALID_REFERENCE,
             "Invalid reference to related record",
         ),
-        re.compile(r"violates not-null constraint"): (
+        (
+            re.compile(r"violates not-null constraint"),
             ErrorCode.DB_MISSING_REQUIRED,
             "Required field is missing",
         ),
-        re.compile(r"violates check constraint"): (
+        (
+            re.compile(r"violates check constraint"),
             ErrorCode.DB_CONSTRAINT_VIOLATION,
             "Value violates constraint",
         ),
         # MySQL patterns
-        re.compile(r"Duplicate entry .* for key"): (
+        (
+            re.compile(r"Duplicate entry .* for key"),
             ErrorCode.DB_DUPLICATE_ENTRY,
             "Record already exists",
         ),
-        re.compile(
-            r"Cannot add or update a child row: a foreign key constraint fails"
-        ): (ErrorCode.DB_INVALID_REFERENCE, "Invalid reference to related record"),
-        re.compile(r"Column .* cannot be null"): (
+        (
+            re.compile(
+                r"Cannot add or update a child row: a foreign key constraint fails"
+            ),
+            ErrorCode.DB_INVALID_REFERENCE,
+            "Invalid reference to related record",
+        ),
+        (
+            re.compile(r"Column .* cannot be null"),
             ErrorCode.DB_MISSING_REQUIRED,
             "Required field is missing",
         ),
         # SQLite patterns
-        re.compile(r"UNIQUE constraint failed"): (
+        (
+            re.compile(r"UNIQUE constraint failed"),
             ErrorCode.DB_DUPLICATE_ENTRY,
             "Record already exists",
         ),
-        re.compile(r"FOREIGN KEY constraint failed"): (
+        (
+            re.compile(r"FOREIGN KEY constraint failed"),
             ErrorCode.DB_INVALID_REFERENCE,
             "Invalid reference to related record",
         ),
-        re.compile(r"NOT NULL constraint failed"): (
+        (
+            re.compile(r"NOT NULL constraint failed"),
             ErrorCode.DB_MISSING_REQUIRED,
             "Required field is missing",
         ),
-    }
+    ]
+
+    # All patterns in a single regex, so one search classifies an error
+    _SQL_PATTERN_RE, _SQL_PATTERN_OUTCOMES = _combine_patterns(SQL_PATTERNS)
+
+    # All detail extractors in a single regex, so one scan finds every field
+    _DETAIL_RE, _DETAIL_GROUPS = _combine_detail_patterns(_DETAIL_PATTERNS)
+
+    # Case-insensitive match, without lowercasing a copy of the message
+    _CONNECTION_RE = re.compile(r"connection", re.IGNORECASE)
 
     @classmethod
     def convert(cls, error: Exception) -> DatabaseError:
@@ -84,48 +157,50 @@ class SQLErrorConverter:
         """Convert IntegrityError to DatabaseError with detailed field information."""
         error_str = str(error.orig) if error.orig else str(error)
 
-        # Check patterns
-        for pattern, (code, message) in cls.SQL_PATTERNS.items():
-            if pattern.search(error_str):
-                db_error = DatabaseError(
-                    message=message,
-                    code=code,
-                    sql_error=error_str,
-                    table=cls._extract_table_name(error_str),
-                )
-
-                # Add detailed field information
-                field_name = cls._extract_field_name(error_str)
-                if field_name:
-                    db_error.details["field"] = field_name
-
-                constraint_name = cls._extract_constraint_name(error_str)
-                if constraint_name:
-                    db_error.details["constraint"] = constraint_name
-
-                # For duplicate entries, extract the duplicate value
-                if code == ErrorCode.DB_DUPLICATE_ENTRY:
-                    duplicate_value = cls._extract_duplicate_value(error_str)
-                    if duplicate_value:
-                        db_error.details["duplicate_value"] = duplicate_value
-                        db_error.message = (
-                            f"{message}: {field_name}={duplicate_value}"
-                            if field_name
-                            else f"{message}: {duplicate_value}"
-                        )
-
-                # For missing required fields
-                elif code == ErrorCode.DB_MISSING_REQUIRED and field_name:
-                    db_error.message = f"{message}: {field_name}"
-
-                # For invalid references
-                elif code == ErrorCode.DB_INVALID_REFERENCE and field_name:
-                    db_error.message = f"{message} in field: {field_name}"
-
-                if db_error.details.get("table"):
-                    db_error.details["table"] = db_error.details["table"]
-
-                return db_error
+        # Classify the error with one search over the combined patterns
+        match = cls._SQL_PATTERN_RE.search(error_str)
+        if match is not None and match.lastgroup is not None:
+            code, message = cls._SQL_PATTERN_OUTCOMES[match.lastgroup]
+            extracted = cls._extract_all(error_str)
+            db_error = DatabaseError(
+                message=message,
+                code=code,
+                sql_error=error_str,
+                table=extracted.get("table"),
+            )
+
+            # Add detailed field information
+            field_name = extracted.get("field")
+            if field_name:
+                db_error.details["field"] = field_name
+
+            constraint_name = extracted.get("constraint")
+            if constraint_name:
+                db_error.details["constraint"] = constraint_name
+
+            # For duplicate entries, add the duplicate value
+            if code == ErrorCode.DB_DUPLICATE_ENTRY:
+                duplicate_value = extracted.get("duplicate_value")
+                if duplicate_value:
+                    db_error.details["duplicate_value"] = duplicate_value
+                    db_error.message = (
+                        f"{message}: {field_name}={duplicate_value}"
+                        if field_name
+                        else f"{message}: {duplicate_value}"
+                    )
+
+            # For missing required fields
+            elif code == ErrorCode.DB_MISSING_REQUIRED and field_name:
+                db_error.message = f"{message}: {field_name}"
+
+            # For invalid references
+            elif code == ErrorCode.DB_INVALID_REFERENCE and field_name:
+                db_error.message = f"{message} in field: {field_name}"
+
+            if db_error.details.get("table"):
+                db_error.details["table"] = db_error.details["table"]
+
+            return db_error
 
         # Default integrity error
         return DatabaseError(
@@ -148,7 +223,7 @@ class SQLErrorConverter:
         """Convert OperationalError to DatabaseError."""
         error_str = str(error.orig) if error.orig else str(error)
 
-        if "connection" in error_str.lower():
+        if cls._CONNECTION_RE.search(error_str):
             return DatabaseError(
                 message="Database connection error",
                 code=ErrorCode.DB_CONNECTION_ERROR,
@@ -182,71 +257,20 @@ class SQLErrorConverter:
         )
 
     @classmethod
-    def _extract_table_name(cls, error_str: str) -> Optional[str]:
-        """Extract table name from error string."""
-        # PostgreSQL pattern
-        match = re.search(r'relation "([^"]+)"', error_str)
-        if match:
-            return match.group(1)
-
-        # MySQL pattern
-        match = re.search(r"`([^`]+)`\.`([^`]+)`", error_str)
-        if match:
-            return match.group(2)
-
-        # SQLite pattern
-        match = re.search(r"table (\w+)", error_str)
-        if match:
-            return match.group(1)
-
-        return None
-
-    @classmethod
-    def _extract_field_name(cls, error_str: str) -> Optional[str]:
-        """Extract field/column name from error string."""
-        # PostgreSQL patterns
-        match = re.search(r'column "([^"]+)"', error_str)
-        if match:
-            return match.group(1)
-
-        # MySQL patterns
-        match = re.search(r"Column '([^']+)'", error_str)
-        if match:
-            return match.group(1)
-
-        # SQLite patterns
-        match = re.search(r"column (\w+)", error_str)
-        if match:
-            return match.group(1)
-
-        return None
-
-    @classmethod
-    def _extract_constraint_name(cls, error_str: str) -> Optional[str]:
-        """Extract constraint name from error string."""
-        # PostgreSQL pattern
-        match = re.search(r'constraint "([^"]+)"', error_str)
-        if match:
-            return match.group(1)
-
-        # MySQL pattern
-        match = re.search(r"key '([^']+)'", error_str)
-        if match:
-            return match.group(1)
-
-        return None
-
-    @classmethod
-    def _extract_duplicate_value(cls, error_str: str) -> Optional[str]:
-        """Extract duplicate value from error string."""
-        # PostgreSQL pattern
-        match = re.search(r"Key \([^)]+\)=\(([^)]+)\)", error_str)
-        if match:
-            return match.group(1)
-
-        # MySQL pattern
-        match = re.search(r"Duplicate entry '([^']+)'", error_str)
-        if match:
-            return match.group(1)
-
-        return None
+    def _extract_all(cls, error_str: str) -> Dict[str, str]:
+        """Extract table, field, constraint and duplicate value in one scan.
+
+        For each detail the highest-priority pattern wins, and among matches
+        of that pattern the first occurrence in the message.
+        """
+        found: Dict[str, str] = {}
+        priorities: Dict[str, int] = {}
+        groups = cls._DETAIL_GROUPS
+
+        for match in cls._DETAIL_RE.finditer(error_str):
+            field, priority, value_index = groups[cast(str, match.lastgroup)]
+            if priority < priorities.get(field, len(_DETAIL_PATTERNS[field])):
+                priorities[field] = priority
+                found[field] = match.group(value_index)
+
+        return found
@@ -1,5 +1,7 @@
-from typing import Any, Optional
+import functools
+from typing import Any, Callable, Dict, Optional
 
+import msgspec
 from sqlalchemy.exc import SQLAlchemyError
 
 from ..core.error_codes import ErrorCode
@@ -24,6 +26,108 @@ except ImportError:  # pragma: no cover
 else:  # pragma: no cover
     _PydanticErrorConverter = _LoadedPydanticErrorConverter
 
+Converter = Callable[[Exception], AppError]
+
+# Reused by ``_is_serializable`` probes
+_JSON_ENCODER = msgspec.json.Encoder()
+
+# Converters keyed by exception class; an error is handled by the entry for the
+# most specific class in its MRO.
+_CONVERTERS: Dict[type, Converter] = {}
+
+
+def register_converter(exc_type: type, converter: Converter) -> None:
+    """
+    Register a converter for an exception class and its subclasses.
+
+    Args:
+        exc_type: Exception class handled by the converter
+        converter: Callable turning an instance of ``exc_type`` into an AppError
+    """
+    _CONVERTERS[exc_type] = converter
+    _resolve_converter.cache_clear()
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_converter(error_type: type) -> Optional[Converter]:
+    """Find the converter for an exception class, cached per class."""
+    for cls in error_type.__mro__:
+        converter = _CONVERTERS.get(cls)
+        if converter is not None:
+            return converter
+
+    # Standard Python exceptions are matched on the exact type only
+    if error_type in PythonErrorConverter.EXCEPTION_MAP:
+        return PythonErrorConverter.convert
+
+    return _resolve_special_case(error_type)
+
+
+def _convert_pydantic(error: Exception) -> AppError:
+    if _PydanticErrorConverter is None:
+        raise ImportError(
+            "Install 'awesome-errors[pydantic]' to convert Pydantic validation errors."
+        ) from None
+    return _PydanticErrorConverter.convert(error)
+
+
+def _convert_app_error(error: Exception) -> AppError:
+    return error  # type: ignore[return-value]
+
+
+register_converter(AppError, _convert_app_error)
+register_converter(SQLAlchemyError, SQLErrorConverter.convert)
+if PydanticValidationErrorType is not None:  # pragma: no cover - optional dependency
+    register_converter(PydanticValidationErrorType, _convert_pydantic)
+
+
+def _convert_http_error(error: Exception) -> AppError:
+    return AppError(
+        code=ErrorCode.INTERNAL_ERROR,
+        message="HTTP request failed",
+        details={"error_type": type(error).__name__, "error": str(error)},
+    )
+
+
+def _convert_json_error(error: Exception) -> AppError:
+    return AppError(
+        code=ErrorCode.INVALID_FORMAT,
+        message="Invalid JSON format",
+        details={"error_type": type(error).__name__, "error": str(error)},
+    )
+
+
+def _convert_import_error(error: Exception) -> AppError:
+    return AppError(
+        code=ErrorCode.INTERNAL_ERROR,
+        message="Missing required module",
+        details={
+            "module": getattr(error, "name", None) or "unknown",
+            "error": str(error),
+        },
+    )
+
+
+def _resolve_special_case(error_type: type) -> Optional[Converter]:
+    """Find the special-case converter for an exception class.
+
+    HTTP and JSON errors come from many client libraries, so they are
+    recognised by class name rather than by importing each library.
+    """
+    # Handle HTTP-related errors
+    if "HTTPError" in error_type.__name__:
+        return _convert_http_error
+
+    # Handle JSON errors
+    if "JSONDecodeError" in error_type.__name__:
+        return _convert_json_error
+
+    # Handle import errors (ModuleNotFoundError included)
+    if issubclass(error_type, ImportError):
+        return _convert_import_error
+
+    return None
+
 
 class UniversalErrorConverter:
     """Universal error converter that handles any type of exception."""
@@ -40,78 +144,20 @@ class UniversalErrorConverter:
         Returns:
             AppError instance with appropriate details
         """
-        # Check if it's already an AppError
-        if isinstance(error, AppError):
-            return error
-
-        # Pydantic validation errors
-        if PydanticValidationErrorType is not None and isinstance(
-            error, PydanticValidationErrorType
-        ):
-            if _PydanticErrorConverter is None:
-                raise ImportError(
-                    "Install 'awesome-errors[pydantic]' to convert Pydantic validation errors."
-                ) from None
-            return _PydanticErrorConverter.convert(error)
-
-        # SQLAlchemy errors
-        if isinstance(error, SQLAlchemyError):
-            return SQLErrorConverter.convert(error)
-
-        # Standard Python exceptions
-        if type(error) in PythonErrorConverter.EXCEPTION_MAP:
-            return PythonErrorConverter.convert(error)
-
-        # Handle other specific error types
-        app_error = cls._handle_special_cases(error)
-        if app_error:
-            return app_error
+        # One cached lookup per class covers registered converters, standard
+        # Python exceptions and the HTTP/JSON/import special cases
+        converter = _resolve_converter(type(error))
+        if converter is not None:
+            return converter(error)
 
         # Default handling for unknown errors
         return generic_error_handler(error, debug)
 
-    @classmethod
-    def _handle_special_cases(cls, error: Exception) -> Optional[AppError]:
-        """Handle special error cases."""
-        error_type = type(error).__name__
-        error_str = str(error)
-
-        # Handle HTTP-related errors
-        if "HTTPError" in error_type:
-            return AppError(
-                code=ErrorCode.INTERNAL_ERROR,
-                message="HTTP request failed",
-                details={"error_type": error_type, "error": error_str},
-            )
-
-        # Handle JSON errors
-        if "JSONDecodeError" in error_type:
-            return AppError(
-                code=ErrorCode.INVALID_FORMAT,
-                message="Invalid JSON format",
-                details={"error_type": error_type, "error": error_str},
-            )
-
-        # Handle import errors
-        if isinstance(error, (ImportError, ModuleNotFoundError)):
-            return AppError(
-                code=ErrorCode.INTERNAL_ERROR,
-                message="Missing required module",
-                details={
-                    "module": error.name if hasattr(error, "name") else "unknown",
-                    "error": error_str,
-                },
-            )
-
-        return None
-
     @staticmethod
     def _is_serializable(value: Any) -> bool:
         """Check if value can be safely serialized."""
         try:
-            import json
-
-            json.dumps(value)
+            _JSON_ENCODER.encode(value)
             return True
-        except Exception:
+        except (TypeError, ValueError, RecursionError, msgspec.EncodeError):
             return False
@@ -1,3 +1,5 @@
+import functools
+import sys
 from enum import StrEnum
 from typing import Dict
 
@@ -47,17 +49,43 @@ class ErrorCode(StrEnum):
     RATE_LIMIT_EXCEEDED = "RATE_LIMIT_EXCEEDED"
     SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
 
+    # HTTP status, attached to every member below ERROR_HTTP_STATUS_MAP
+    _http_status: int
+
     @classmethod
     def _missing_(cls, value):
         """Create new ErrorCode for unknown values."""
         if isinstance(value, str):
-            # Create a pseudo member for custom values
-            pseudo_member = str.__new__(cls, value)
-            pseudo_member._name_ = value
-            pseudo_member._value_ = value
-            return pseudo_member
+            return _custom_code(value)
         return None
 
+    @classmethod
+    def get(cls, value: str) -> "ErrorCode":
+        """Return the member for ``value`` via a plain dict lookup.
+
+        Equivalent to ``ErrorCode(value)`` but skips the enum call machinery;
+        unknown strings go straight to the bounded custom-code cache.
+        """
+        member = _CODE_CACHE.get(value)
+        if member is None:
+            member = _custom_code(value) if isinstance(value, str) else cls(value)
+        return member
+
+
+_CODE_CACHE: Dict[str, ErrorCode] = {sys.intern(code.value): code for code in ErrorCode}
+
+
+# Pseudo members for custom code strings. Bounded, since arbitrary values
+# passed to ``ErrorCode(...)`` would otherwise be kept forever.
+@functools.lru_cache(maxsize=1024)
+def _custom_code(value: str) -> ErrorCode:
+    """Build (or reuse) the pseudo member for a custom code string."""
+    pseudo_member = str.__new__(ErrorCode, value)
+    pseudo_member._name_ = value
+    pseudo_member._value_ = value
+    pseudo_member._http_status = 500
+    return pseudo_member
+
 
 ERROR_HTTP_STATUS_MAP: Dict[ErrorCode, int] = {
     # 400 Bad Request
@@ -98,7 +126,26 @@ ERROR_HTTP_STATUS_MAP: Dict[ErrorCode, int] = {
     ErrorCode.DB_MISSING_REQUIRED: 422,
 }
 
+# Store each status on its member: the lookup becomes an attribute read
+# instead of hashing the member through Enum.__hash__
+for _code in ErrorCode:
+    _code._http_status = ERROR_HTTP_STATUS_MAP.get(_code, 500)
+del _code
+
+
+# Error codes used for framework HTTP exceptions, keyed by status code
+HTTP_STATUS_ERROR_CODES: Dict[int, ErrorCode] = {
+    400: ErrorCode.INVALID_INPUT,
+    401: ErrorCode.AUTH_REQUIRED,
+    403: ErrorCode.AUTH_PERMISSION_DENIED,
+    404: ErrorCode.RESOURCE_NOT_FOUND,
+    422: ErrorCode.VALIDATION_FAILED,
+}
+
 
 def get_http_status(error_code: ErrorCode) -> int:
     """Get HTTP status code for an error code."""
-    return ERROR_HTTP_STATUS_MAP.get(error_code, 500)
+    try:
+        return error_code._http_status
+    except AttributeError:  # plain strings
+        return ERROR_HTTP_STATUS_MAP.get(error_code, 500)
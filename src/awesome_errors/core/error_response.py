@@ -12,6 +12,17 @@ def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _isoformat_utc(dt: datetime) -> str:
+    """Format ``dt`` as ISO 8601 in UTC with a ``Z`` suffix (naive means UTC)."""
+    if dt.tzinfo is not timezone.utc:
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        else:
+            dt = dt.astimezone(timezone.utc)
+    # ``isoformat`` runs in C; it beats strftime or manual field formatting
+    return dt.isoformat().replace("+00:00", "Z")
+
+
 class ErrorDetail(msgspec.Struct, kw_only=True, omit_defaults=True):
     """Serializable representation of an application error."""
 
@@ -23,14 +34,11 @@ class ErrorDetail(msgspec.Struct, kw_only=True, omit_defaults=True):
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to builtin types, ensuring ISO timestamps."""
-        data = msgspec.to_builtins(self, builtin_types=None)
-        timestamp = data.get("timestamp")
-        if isinstance(timestamp, datetime):
-            data["timestamp"] = timestamp.isoformat().replace("+00:00", "Z")
-        elif isinstance(timestamp, str):
-            data["timestamp"] = timestamp
-        else:
-            data["timestamp"] = _now_utc().isoformat().replace("+00:00", "Z")
+        # ``to_builtins`` already encodes datetimes as ISO strings; only a
+        # missing or invalid timestamp needs filling in
+        data = msgspec.to_builtins(self)
+        if type(data.get("timestamp")) is not str:
+            data["timestamp"] = _isoformat_utc(_now_utc())
         return data
 
 
@@ -44,18 +52,27 @@ class ErrorResponse(msgspec.Struct, kw_only=True, omit_defaults=True):
 
 
 def error_detail_from_mapping(data: Mapping[str, Any]) -> ErrorDetail:
-    """Construct an ``ErrorDetail`` from mapping data."""
+    """Construct an ``ErrorDetail`` from mapping data.
+
+    A ``details`` value that is already a ``dict`` is used as is, not copied.
+    """
     timestamp = data.get("timestamp")
     if isinstance(timestamp, str):
         try:
-            timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            if timestamp.endswith("Z"):
+                timestamp = timestamp[:-1] + "+00:00"
+            timestamp = datetime.fromisoformat(timestamp)
         except ValueError:
             timestamp = _now_utc()
 
+    details = data.get("details")
+    if type(details) is not dict:
+        details = dict(details) if details else {}
+
     return ErrorDetail(
         code=str(data.get("code", "UNKNOWN_ERROR")),
         message=str(data.get("message", "")),
-        details=dict(data.get("details") or {}),
+        details=details,
         timestamp=timestamp if isinstance(timestamp, datetime) else _now_utc(),
         request_id=str(data.get("request_id", "")),
     )
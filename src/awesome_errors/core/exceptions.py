@@ -1,13 +1,27 @@
-from typing import Any, ClassVar, Dict, Optional, Union, TYPE_CHECKING
+from typing import Any, ClassVar, Dict, Optional, Tuple, Union, TYPE_CHECKING
 from datetime import datetime, timezone
+import copyreg
+import functools
 import uuid
 
 from .error_codes import ErrorCode, get_http_status
+from .error_response import _isoformat_utc
 
 if TYPE_CHECKING:
     from litestar.openapi.datastructures import ResponseSpec
 
 
+@functools.lru_cache(maxsize=None)
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """Return every slot declared along the MRO of ``cls``."""
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name in klass.__dict__.get("__slots__", ())
+        if name not in ("__dict__", "__weakref__")
+    )
+
+
 class AppError(Exception):
     """
     Base application error class for server-side error handling.
@@ -23,11 +37,20 @@ class AppError(Exception):
         raise AppError(ErrorCode.USER_NOT_FOUND, "User not found", {"user_id": 123})
     """
 
+    __slots__ = (
+        "code",
+        "message",
+        "details",
+        "timestamp",
+        "_request_id",
+        "status_code",
+    )
+
     code: ErrorCode
     message: str
     details: Dict[str, Any]
     timestamp: datetime
-    request_id: str | None
+    _request_id: str | None
     status_code: int
 
     def __init__(
@@ -38,23 +61,68 @@ class AppError(Exception):
         status_code: Optional[int] = None,
     ):
         super().__init__(message)
-        self.code = code if isinstance(code, ErrorCode) else ErrorCode(code)
+        self.code = code if type(code) is ErrorCode else ErrorCode.get(code)
         self.message = message
-        self.details = details or {}
+        # Keep the caller's dict even when empty: subclasses already built
+        # one, and middleware adds keys to ``details`` in place
+        self.details = details if details is not None else {}
         self.timestamp = datetime.now(timezone.utc)
-        self.request_id = str(uuid.uuid4())
 
         # Use provided status code or get from mapping
-        self.status_code = status_code or get_http_status(self.code)
+        self.status_code = status_code or self.code._http_status
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Support ``pickle`` and ``copy`` despite ``__slots__``.
+
+        ``BaseException.__reduce__`` only carries ``args`` and ``__dict__`` and
+        re-runs ``__init__`` with ``args``, which subclasses with their own
+        signatures cannot take. The instance is rebuilt without ``__init__``
+        and every slot that is set is restored, so the copy keeps its
+        ``request_id`` and ``timestamp``.
+        """
+        # Generate the lazy request ID now so the copy shares it
+        self.request_id
+        slots = {
+            name: getattr(self, name)
+            for name in _slot_names(type(self))
+            if hasattr(self, name)
+        }
+        return copyreg.__newobj__, (type(self), *self.args), (self.__dict__, slots)
+
+    def __setstate__(self, state: Tuple[Dict[str, Any], Dict[str, Any]]) -> None:
+        attrs, slots = state
+        self.__dict__.update(attrs)
+        for name, value in slots.items():
+            object.__setattr__(self, name, value)
+
+    @property
+    def request_id(self) -> str | None:
+        """Request ID for tracing.
+
+        Generated on first read, so errors that are caught and discarded never
+        pay for ``uuid4``; an explicitly assigned value, including ``None``,
+        is kept as is.
+        """
+        try:
+            return self._request_id
+        except AttributeError:
+            self._request_id = str(uuid.uuid4())
+            return self._request_id
+
+    @request_id.setter
+    def request_id(self, value: str | None) -> None:
+        self._request_id = value
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert error to dictionary for JSON serialization."""
+        # ``_value_`` is a plain member attribute; ``.value`` is an enum
+        # property that costs several times more per read
         return {
             "error": {
-                "code": self.code.value,
+                "code": self.code._value_,
                 "message": self.message,
                 "details": self.details,
-                "timestamp": self.timestamp.isoformat() + "Z",
+                "timestamp": _isoformat_utc(self.timestamp),
                 "request_id": self.request_id,
             }
         }
@@ -63,6 +131,8 @@ class AppError(Exception):
 class APIError(AppError):
     """Base HTTP-facing error with OpenAPI metadata."""
 
+    __slots__ = ()
+
     error_code: ClassVar[Union[ErrorCode, str]] = ErrorCode.UNKNOWN_ERROR
     http_status_code: ClassVar[int | None] = None
     title: ClassVar[str] = "Internal error"
@@ -77,39 +147,27 @@ class APIError(AppError):
         status_code: Optional[int] = None,
     ):
         effective_code = code or self.error_code
-        if status_code is not None:
-            effective_status = status_code
-        elif code is not None:
-            normalized = (
-                effective_code
-                if isinstance(effective_code, ErrorCode)
-                else ErrorCode(effective_code)
-            )
-            effective_status = get_http_status(normalized)
-        else:
-            normalized = (
-                effective_code
-                if isinstance(effective_code, ErrorCode)
-                else ErrorCode(effective_code)
-            )
-            effective_status = (
-                self.http_status_code
-                if self.http_status_code is not None
-                else get_http_status(normalized)
-            )
-        super().__init__(
-            effective_code,
-            message or self.title,
-            details,
-            effective_status,
+        normalized = (
+            effective_code
+            if type(effective_code) is ErrorCode
+            else ErrorCode.get(effective_code)
         )
+        if status_code is None:
+            if code is None and self.http_status_code is not None:
+                status_code = self.http_status_code
+            else:
+                status_code = get_http_status(normalized)
+        # Pass the normalized member so AppError does not resolve it again
+        super().__init__(normalized, message or self.title, details, status_code)
 
     @classmethod
     def get_status_code(cls) -> int:
         if cls.http_status_code is not None:
             return cls.http_status_code
         error_code = (
-            cls.error_code if isinstance(cls.error_code, ErrorCode) else ErrorCode(cls.error_code)
+            cls.error_code
+            if type(cls.error_code) is ErrorCode
+            else ErrorCode.get(cls.error_code)
         )
         return get_http_status(error_code)
 
@@ -139,6 +197,8 @@ class ValidationError(APIError):
         raise ValidationError("Email is required", field="email")
     """
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.VALIDATION_FAILED
     http_status_code: ClassVar[int] = 400
     title: ClassVar[str] = "Request validation failed"
@@ -149,7 +209,7 @@ class ValidationError(APIError):
         message: Optional[str] = None,
         field: Optional[str] = None,
         value: Any = None,
-        code: ErrorCode = ErrorCode.VALIDATION_FAILED,
+        code: ErrorCode | None = None,
     ):
         details: Dict[str, Any] = {}
         if field:
@@ -163,35 +223,32 @@ class ValidationError(APIError):
 class InvalidInputError(ValidationError):
     """Invalid input error (HTTP 400)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.INVALID_INPUT
     title: ClassVar[str] = "Invalid input"
     description: ClassVar[str] = "Invalid input"
 
-    def __init__(self, message: Optional[str] = None, field: Optional[str] = None):
-        super().__init__(message or self.title, field=field, code=self.error_code)
-
 
 class MissingRequiredFieldError(ValidationError):
     """Missing required field error (HTTP 400)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.MISSING_REQUIRED_FIELD
     title: ClassVar[str] = "Missing required field"
     description: ClassVar[str] = "Missing required field"
 
-    def __init__(self, message: Optional[str] = None, field: Optional[str] = None):
-        super().__init__(message or self.title, field=field, code=self.error_code)
-
 
 class InvalidFormatError(ValidationError):
     """Invalid format error (HTTP 400)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.INVALID_FORMAT
     title: ClassVar[str] = "Invalid format"
     description: ClassVar[str] = "Invalid format"
 
-    def __init__(self, message: Optional[str] = None, field: Optional[str] = None):
-        super().__init__(message or self.title, field=field, code=self.error_code)
-
 
 class AuthError(APIError):
     """
@@ -204,6 +261,8 @@ class AuthError(APIError):
         raise AuthError("Admin access required", required_permission="admin.users.read")
     """
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.AUTH_REQUIRED
     http_status_code: ClassVar[int] = 401
     title: ClassVar[str] = "Authentication required"
@@ -216,9 +275,9 @@ class AuthError(APIError):
         required_permission: Optional[str] = None,
         status_code: Optional[int] = None,
     ):
-        details: Dict[str, Any] = {}
-        if required_permission:
-            details["required_permission"] = required_permission
+        details: Dict[str, Any] = (
+            {"required_permission": required_permission} if required_permission else {}
+        )
 
         super().__init__(code, message, details, status_code)
 
@@ -226,6 +285,8 @@ class AuthError(APIError):
 class AuthRequiredError(AuthError):
     """Authentication required error (HTTP 401)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.AUTH_REQUIRED
     title: ClassVar[str] = "Authentication required"
     description: ClassVar[str] = "Authentication required"
@@ -243,28 +304,28 @@ class AuthRequiredError(AuthError):
 class AuthInvalidTokenError(AuthError):
     """Invalid token error (HTTP 401)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.AUTH_INVALID_TOKEN
     title: ClassVar[str] = "Invalid token"
     description: ClassVar[str] = "Invalid token"
 
-    def __init__(self, message: Optional[str] = None):
-        super().__init__(message, code=self.error_code)
-
 
 class AuthTokenExpiredError(AuthError):
     """Token expired error (HTTP 401)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.AUTH_TOKEN_EXPIRED
     title: ClassVar[str] = "Token expired"
     description: ClassVar[str] = "Token expired"
 
-    def __init__(self, message: Optional[str] = None):
-        super().__init__(message, code=self.error_code)
-
 
 class AuthPermissionDeniedError(AuthError):
     """Permission denied error (HTTP 403)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.AUTH_PERMISSION_DENIED
     http_status_code: ClassVar[int] = 403
     title: ClassVar[str] = "Access denied"
@@ -284,6 +345,8 @@ class AuthPermissionDeniedError(AuthError):
 class AuthInsufficientPrivilegesError(AuthError):
     """Insufficient privileges error (HTTP 403)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.AUTH_INSUFFICIENT_PRIVILEGES
     http_status_code: ClassVar[int] = 403
     title: ClassVar[str] = "Insufficient privileges"
@@ -303,24 +366,22 @@ class AuthInsufficientPrivilegesError(AuthError):
 class SessionExpiredError(AuthError):
     """Session expired error (HTTP 401)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.SESSION_EXPIRED
     title: ClassVar[str] = "Session has expired"
     description: ClassVar[str] = "Session has expired"
 
-    def __init__(self, message: Optional[str] = None):
-        super().__init__(message or self.title, code=self.error_code)
-
 
 class RefreshTokenReuseDetectedError(AuthError):
     """Refresh token reuse detected (HTTP 401)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.REFRESH_TOKEN_REUSE
     title: ClassVar[str] = "Refresh token reuse detected"
     description: ClassVar[str] = "Refresh token reuse detected"
 
-    def __init__(self, message: Optional[str] = None):
-        super().__init__(message or self.title, code=self.error_code)
-
 
 class NotFoundError(APIError):
     """
@@ -333,6 +394,8 @@ class NotFoundError(APIError):
         raise NotFoundError("user", user_id=123)
     """
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.RESOURCE_NOT_FOUND
     http_status_code: ClassVar[int] = 404
     title: ClassVar[str] = "Resource not found"
@@ -342,15 +405,18 @@ class NotFoundError(APIError):
         self,
         resource: str,
         resource_id: Optional[Union[str, int]] = None,
-        code: ErrorCode = ErrorCode.RESOURCE_NOT_FOUND,
+        code: ErrorCode | None = None,
     ):
-        details: Dict[str, Any] = {"resource": resource}
-        if resource_id is not None:
-            details["resource_id"] = resource_id
-
-        message = f"{resource} not found"
-        if resource_id:
-            message += f" with id: {resource_id}"
+        details: Dict[str, Any] = (
+            {"resource": resource}
+            if resource_id is None
+            else {"resource": resource, "resource_id": resource_id}
+        )
+        message = (
+            f"{resource} not found with id: {resource_id}"
+            if resource_id
+            else f"{resource} not found"
+        )
 
         super().__init__(code, message, details, 404)
 
@@ -358,17 +424,18 @@ class NotFoundError(APIError):
 class ResourceNotFoundError(NotFoundError):
     """Resource not found error (HTTP 404)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.RESOURCE_NOT_FOUND
     title: ClassVar[str] = "Resource not found"
     description: ClassVar[str] = "Resource not found"
 
-    def __init__(self, resource: str, resource_id: Optional[Union[str, int]] = None):
-        super().__init__(resource, resource_id=resource_id, code=self.error_code)
-
 
 class UserNotFoundError(NotFoundError):
     """User not found error (HTTP 404)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.USER_NOT_FOUND
     title: ClassVar[str] = "User not found"
     description: ClassVar[str] = "User not found"
@@ -380,6 +447,8 @@ class UserNotFoundError(NotFoundError):
 class EntityNotFoundError(NotFoundError):
     """Entity not found error (HTTP 404)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.ENTITY_NOT_FOUND
     title: ClassVar[str] = "Entity not found"
     description: ClassVar[str] = "Entity not found"
@@ -391,6 +460,8 @@ class EntityNotFoundError(NotFoundError):
 class OAuthProviderUnknownError(NotFoundError):
     """OAuth provider not found error (HTTP 404)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.OAUTH_PROVIDER_UNKNOWN
     title: ClassVar[str] = "OAuth provider not found"
     description: ClassVar[str] = "OAuth provider not found"
@@ -410,6 +481,8 @@ class DatabaseError(APIError):
         raise DatabaseError("Duplicate email", table="users", sql_error="...")
     """
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.DB_QUERY_ERROR
     title: ClassVar[str] = "Database query error"
     description: ClassVar[str] = "Database query error"
@@ -417,7 +490,7 @@ class DatabaseError(APIError):
     def __init__(
         self,
         message: Optional[str] = None,
-        code: ErrorCode = ErrorCode.DB_QUERY_ERROR,
+        code: ErrorCode | None = None,
         sql_error: Optional[str] = None,
         table: Optional[str] = None,
     ):
@@ -433,6 +506,8 @@ class DatabaseError(APIError):
 class DatabaseConnectionError(DatabaseError):
     """Database connection error (HTTP 500)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.DB_CONNECTION_ERROR
     title: ClassVar[str] = "Database connection error"
     description: ClassVar[str] = "Database connection error"
@@ -444,6 +519,8 @@ class DatabaseConnectionError(DatabaseError):
 class DatabaseQueryError(DatabaseError):
     """Database query error (HTTP 500)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.DB_QUERY_ERROR
     title: ClassVar[str] = "Database query error"
     description: ClassVar[str] = "Database query error"
@@ -455,6 +532,8 @@ class DatabaseQueryError(DatabaseError):
 class DatabaseTransactionError(DatabaseError):
     """Database transaction error (HTTP 500)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.DB_TRANSACTION_ERROR
     title: ClassVar[str] = "Database transaction error"
     description: ClassVar[str] = "Database transaction error"
@@ -466,6 +545,8 @@ class DatabaseTransactionError(DatabaseError):
 class DatabaseConstraintViolationError(DatabaseError):
     """Database constraint violation (HTTP 409)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.DB_CONSTRAINT_VIOLATION
     title: ClassVar[str] = "Database constraint violation"
     description: ClassVar[str] = "Database constraint violation"
@@ -487,6 +568,8 @@ class DatabaseConstraintViolationError(DatabaseError):
 class DatabaseDuplicateEntryError(DatabaseError):
     """Database duplicate entry (HTTP 409)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.DB_DUPLICATE_ENTRY
     title: ClassVar[str] = "Database duplicate entry"
     description: ClassVar[str] = "Database duplicate entry"
@@ -508,6 +591,8 @@ class DatabaseDuplicateEntryError(DatabaseError):
 class DatabaseInvalidReferenceError(DatabaseError):
     """Database invalid reference (HTTP 422)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.DB_INVALID_REFERENCE
     title: ClassVar[str] = "Database invalid reference"
     description: ClassVar[str] = "Database invalid reference"
@@ -529,6 +614,8 @@ class DatabaseInvalidReferenceError(DatabaseError):
 class DatabaseMissingRequiredError(DatabaseError):
     """Database missing required field (HTTP 422)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.DB_MISSING_REQUIRED
     title: ClassVar[str] = "Database missing required field"
     description: ClassVar[str] = "Database missing required field"
@@ -558,6 +645,8 @@ class BusinessLogicError(APIError):
         raise BusinessLogicError("Insufficient balance", rule="min_balance", context={"current": 50})
     """
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.BUSINESS_RULE_VIOLATION
     http_status_code: ClassVar[int] = 422
     title: ClassVar[str] = "Business rule violation"
@@ -566,7 +655,7 @@ class BusinessLogicError(APIError):
     def __init__(
         self,
         message: Optional[str] = None,
-        code: ErrorCode = ErrorCode.BUSINESS_RULE_VIOLATION,
+        code: ErrorCode | None = None,
         rule: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
     ):
@@ -582,6 +671,8 @@ class BusinessLogicError(APIError):
 class InsufficientBalanceError(BusinessLogicError):
     """Insufficient balance error (HTTP 422)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.INSUFFICIENT_BALANCE
     title: ClassVar[str] = "Insufficient balance"
     description: ClassVar[str] = "Insufficient balance"
@@ -599,6 +690,8 @@ class InsufficientBalanceError(BusinessLogicError):
 class OperationNotAllowedError(BusinessLogicError):
     """Operation not allowed error (HTTP 422)."""
 
+    __slots__ = ()
+
     error_code: ClassVar[ErrorCode] = ErrorCode.OPERATION_NOT_ALLOWED
     title: ClassVar[str] = "Operation not allowed"
     description: ClassVar[str] = "Operation not allowed"
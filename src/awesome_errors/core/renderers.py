@@ -4,21 +4,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from ..core.exceptions import AppError
-from .error_response import ErrorDetail, ErrorResponse
+import msgspec
 
+from ..core.exceptions import AppError
+from .error_response import ErrorDetail, ErrorResponse, _isoformat_utc
 
-from datetime import timezone
 
+# Per-format constants shared by every rendered response
+_JSON_MEDIA_TYPE = "application/json"
+_PROBLEM_MEDIA_TYPE = "application/problem+json"
+_DEFAULT_PROBLEM_TYPE = "about:blank"
 
-def _isoformat(dt):
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    else:
-        dt = dt.astimezone(timezone.utc)
-    return dt.isoformat().replace("+00:00", "Z")
+_json_encoder = msgspec.json.Encoder()
 
 
 class ErrorResponseFormat(StrEnum):
@@ -28,7 +27,7 @@ class ErrorResponseFormat(StrEnum):
     RFC7807 = "rfc7807"
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderResult:
     payload: Dict[str, Any]
     media_type: str
@@ -61,16 +60,39 @@ class ErrorResponseRenderer:
             return self._render_problem_detail(error, message=message, request=request)
         return self._render_legacy(error, message=message)
 
+    def render_bytes(
+        self,
+        error: AppError,
+        *,
+        message: str,
+        request: Optional[Any] = None,
+    ) -> Tuple[bytes, str]:
+        """Render ``error`` as encoded JSON, returning the body and media type.
+
+        The legacy envelope is encoded straight from its msgspec structs,
+        skipping the intermediate dictionary built by ``render``.
+        """
+        if self.format == ErrorResponseFormat.RFC7807:
+            rendered = self._render_problem_detail(
+                error, message=message, request=request
+            )
+            return _json_encoder.encode(rendered.payload), rendered.media_type
+        envelope = self._legacy_envelope(error, message=message)
+        return _json_encoder.encode(envelope), _JSON_MEDIA_TYPE
+
     def _render_legacy(self, error: AppError, *, message: str) -> RenderResult:
+        envelope = self._legacy_envelope(error, message=message)
+        return RenderResult(payload=envelope.to_dict(), media_type=_JSON_MEDIA_TYPE)
+
+    def _legacy_envelope(self, error: AppError, *, message: str) -> ErrorResponse:
         detail = ErrorDetail(
-            code=error.code.value,
+            code=error.code._value_,
             message=message,
             details=error.details,
             timestamp=error.timestamp,
             request_id=error.request_id or "unknown",
         )
-        envelope = ErrorResponse(error=detail)
-        return RenderResult(payload=envelope.to_dict(), media_type="application/json")
+        return ErrorResponse(error=detail)
 
     def _render_problem_detail(
         self,
@@ -82,7 +104,7 @@ class ErrorResponseRenderer:
         problem_type = (
             self._problem_type_resolver(error)
             if self._problem_type_resolver
-            else "about:blank"
+            else _DEFAULT_PROBLEM_TYPE
         )
         instance: Optional[str] = None
         if request is not None:
@@ -96,8 +118,8 @@ class ErrorResponseRenderer:
             "status": error.status_code,
             "detail": message,
             "instance": instance,
-            "code": error.code.value,
-            "timestamp": _isoformat(error.timestamp),
+            "code": error.code._value_,
+            "timestamp": _isoformat_utc(error.timestamp),
             "request_id": error.request_id,
             "details": error.details,
         }
@@ -111,5 +133,5 @@ class ErrorResponseRenderer:
 
         return RenderResult(
             payload=payload,
-            media_type="application/problem+json",
+            media_type=_PROBLEM_MEDIA_TYPE,
         )
@@ -1,6 +1,41 @@
-import json
+import functools
+import os
+import threading
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Set
+
+import msgspec
+
+
+@functools.lru_cache(maxsize=2048)
+def parse_accept_language(header: str) -> str:
+    """Return the primary language of an ``Accept-Language`` header.
+
+    Clients send the same header on every request, so results are cached.
+    """
+    return header.split(",")[0].split("-")[0]
+
+
+def _encode_translations(translations: Dict[str, str]) -> bytes:
+    """Encode a locale table as indented UTF-8 JSON, as stored on disk."""
+    return msgspec.json.format(msgspec.json.encode(translations), indent=2)
+
+
+# The temp file name is only unique per process; threads take turns using it
+_WRITE_LOCK = threading.Lock()
+
+
+def _write_translations(path: Path, translations: Dict[str, str]) -> None:
+    """Write a locale file atomically so readers never see a partial file."""
+    data = _encode_translations(translations)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with _WRITE_LOCK:
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
 
 class ErrorTranslator:
@@ -17,7 +52,12 @@ class ErrorTranslator:
         self.locales_dir = locales_dir or Path(__file__).parent / "locales"
         self.default_locale = default_locale
         self._translations: Dict[str, Dict[str, str]] = {}
+        # Per-locale tables with English merged in as the fallback base
+        self._merged: Dict[str, Dict[str, str]] = {}
+        # Locales changed with ``persist=False`` since they were last written
+        self._unpersisted: Set[str] = set()
         self._load_translations()
+        self._rebuild_merged()
 
     def _load_translations(self) -> None:
         """Load all translation files."""
@@ -26,14 +66,27 @@ class ErrorTranslator:
             # Create default English translations
             self._create_default_translations()
 
-        for locale_file in self.locales_dir.glob("*/errors.json"):
-            locale = locale_file.parent.name
-            try:
-                with open(locale_file, "r", encoding="utf-8") as f:
-                    self._translations[locale] = json.load(f)
-            except Exception:
-                # Skip invalid files
-                pass
+        # One directory listing instead of a glob; hidden entries are skipped
+        # like ``glob("*/errors.json")`` did
+        with os.scandir(self.locales_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
+                try:
+                    with open(os.path.join(entry.path, "errors.json"), "rb") as f:
+                        self._translations[entry.name] = msgspec.json.decode(f.read())
+                except Exception:
+                    # Skip missing or invalid files
+                    pass
+
+    def _rebuild_merged(self) -> None:
+        """Rebuild per-locale lookup tables with English fallbacks merged in."""
+        english = {k: v for k, v in self._translations.get("en", {}).items() if v}
+        self._merged = {
+            locale: {**english, **{k: v for k, v in messages.items() if v}}
+            for locale, messages in self._translations.items()
+        }
+        self._merged.setdefault("en", english)
 
     def _create_default_translations(self) -> None:
         """Create default English translations."""
@@ -73,8 +126,7 @@ class ErrorTranslator:
             "OPERATION_NOT_ALLOWED": "Operation not allowed",
         }
 
-        with open(en_dir / "errors.json", "w", encoding="utf-8") as f:
-            json.dump(default_translations, f, indent=2, ensure_ascii=False)
+        _write_translations(en_dir / "errors.json", default_translations)
 
         self._translations["en"] = default_translations
 
@@ -97,28 +149,29 @@ class ErrorTranslator:
         """
         locale = locale or self.default_locale
 
-        # Try requested locale
-        if locale in self._translations:
-            message = self._translations[locale].get(error_code)
-            if message:
-                return self._format_message(message, params)
+        table = self._merged.get(locale)
+        if table is None:
+            # Unknown locales fall back to English (case sensitive)
+            if locale.lower() == "en":
+                return error_code
+            table = self._merged["en"]
 
-        # Fallback to English if available and different from requested locale (case sensitive)
-        if "en" in self._translations and locale.lower() != "en":
-            message = self._translations["en"].get(error_code)
-            if message:
-                return self._format_message(message, params)
-
-        # Return error code if no translation found
-        return error_code
+        message = table.get(error_code)
+        if message is None:
+            # Return error code if no translation found
+            return error_code
+        return self._format_message(message, params)
 
     def _format_message(self, message: str, params: Optional[Dict[str, Any]]) -> str:
         """Format message with parameters."""
-        if not params:
+        if not params or "{" not in message:
+            # Plain templates have nothing to substitute
             return message
 
         try:
-            return message.format(**params)
+            # format_map reads ``params`` directly instead of copying it
+            # into keyword arguments
+            return message.format_map(params)
         except Exception:
             # Return unformatted message if formatting fails
             return message
@@ -133,17 +186,33 @@ class ErrorTranslator:
             translations: Mapping of error codes to translated messages
             persist: Persist changes to disk. Set to ``False`` for ephemeral usage.
         """
-        if locale not in self._translations:
-            self._translations[locale] = {}
-
-        self._translations[locale].update(translations)
+        existing = self._translations.get(locale)
+        if existing is None:
+            existing = self._translations[locale] = {}
+        elif all(
+            key in existing and existing[key] == value
+            for key, value in translations.items()
+        ):
+            # Nothing changed: skip the rebuild, and the write unless an
+            # earlier ``persist=False`` update is still pending
+            if persist and locale in self._unpersisted:
+                self._persist(locale)
+            return
+
+        existing.update(translations)
+        self._rebuild_merged()
 
         if persist:
-            locale_dir = self.locales_dir / locale
-            locale_dir.mkdir(exist_ok=True)
-
-            with open(locale_dir / "errors.json", "w", encoding="utf-8") as f:
-                json.dump(self._translations[locale], f, indent=2, ensure_ascii=False)
+            self._persist(locale)
+        else:
+            self._unpersisted.add(locale)
+
+    def _persist(self, locale: str) -> None:
+        """Write the translations of ``locale`` to its locale file."""
+        locale_dir = self.locales_dir / locale
+        locale_dir.mkdir(exist_ok=True)
+        _write_translations(locale_dir / "errors.json", self._translations[locale])
+        self._unpersisted.discard(locale)
 
     def get_available_locales(self) -> list[str]:
         """Get list of available locales."""
@@ -2,10 +2,12 @@ from .fastapi_auto_docs import (
     setup_automatic_error_docs,
     apply_auto_error_docs_to_router,
     auto_analyze_errors,
+    error_route,
 )
 
 __all__ = [
     "setup_automatic_error_docs",
     "apply_auto_error_docs_to_router",
     "auto_analyze_errors",
+    "error_route",
 ]
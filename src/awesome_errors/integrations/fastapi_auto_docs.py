@@ -3,7 +3,10 @@ FastAPI automatic error documentation integration.
 Automatically analyzes routes and adds error response schemas to OpenAPI docs.
 """
 
+import copy
+import inspect
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +19,91 @@ def auto_analyze_errors(func):
     return decorated_func
 
 
+def error_route(
+    app,
+    method,
+    path,
+    *,
+    additional_errors=None,
+    exclude_errors=None,
+    custom_descriptions=None,
+    **route_kwargs,
+):
+    """
+    Register a route and document its errors in a single decorator.
+
+    Equivalent to stacking ``@openapi_errors(...)`` on ``@app.<method>(path)``,
+    but the endpoint is registered once, with its error responses already in
+    ``responses``, so no wrapper is created and the schema needs no patching.
+
+    Args:
+        app: FastAPI application or APIRouter
+        method: HTTP method name, e.g. ``"get"``
+        path: Route path
+        additional_errors: Additional error codes to include
+        exclude_errors: Error codes to exclude from analysis
+        custom_descriptions: Custom descriptions for error codes
+        **route_kwargs: Passed through to the FastAPI route decorator;
+            explicit ``responses`` take precedence over generated ones
+    """
+    from ..analysis.decorators import openapi_errors
+
+    document_errors = openapi_errors(
+        additional_errors=additional_errors,
+        exclude_errors=exclude_errors,
+        custom_descriptions=custom_descriptions,
+    )
+
+    def decorator(func):
+        # Attaches the analysis and responses to ``func`` itself
+        document_errors(func)
+        responses = {
+            **func._openapi_error_responses,
+            **(route_kwargs.get("responses") or {}),
+        }
+        register = getattr(app, method.lower())
+        return register(path, **{**route_kwargs, "responses": responses})(func)
+
+    return decorator
+
+
+def _endpoint_error_responses(endpoint_func, max_depth, cache):
+    """Return error codes and OpenAPI responses for a route endpoint.
+
+    Responses already built by ``@openapi_errors`` at decoration time are
+    reused as-is instead of re-running the analyzer. Other results are stored
+    in ``cache`` under the unwrapped endpoint's code object, so an endpoint
+    mounted on several routes is analyzed once per walk.
+    """
+    from ..analysis.error_analyzer import ErrorAnalyzer
+    from ..analysis.decorators import _generate_openapi_responses
+
+    openapi_responses = getattr(endpoint_func, "_openapi_error_responses", None)
+    if openapi_responses is not None:
+        analysis = endpoint_func._error_analysis or {}
+        return analysis.get("error_codes", []), openapi_responses
+
+    # Wrappers made with functools.wraps share one __code__ between every
+    # function they decorate; only the wrapped function identifies the endpoint
+    code = getattr(inspect.unwrap(endpoint_func), "__code__", None)
+    if code is not None:
+        cached = cache.get(code)
+        if cached is not None:
+            return cached
+
+    analyzer = ErrorAnalyzer(
+        endpoint_func, max_depth=max_depth, analyze_decorators=True
+    )
+    error_codes = analyzer.analyze().get("error_codes", [])
+    result = (
+        error_codes,
+        _generate_openapi_responses(error_codes, {}) if error_codes else {},
+    )
+    if code is not None:
+        cache[code] = result
+    return result
+
+
 def setup_automatic_error_docs(app, **kwargs):
     """
     Setup automatic error documentation for all FastAPI routes.
@@ -43,6 +131,10 @@ def setup_automatic_error_docs(app, **kwargs):
         # Apply to all routes in the app
         _apply_auto_error_docs_to_app(app, **kwargs)
 
+        # FastAPI caches the generated schema; drop any stale copy so it is
+        # rebuilt once with the new error responses on the next request.
+        app.openapi_schema = None
+
         logger.info("Automatic error documentation setup complete")
 
     except ImportError:
@@ -53,104 +145,42 @@ def setup_automatic_error_docs(app, **kwargs):
 
 def _apply_auto_error_docs_to_app(app, **kwargs):
     """Apply automatic error documentation to all routes in FastAPI app."""
-    from ..analysis.error_analyzer import ErrorAnalyzer
-    from ..analysis.decorators import _generate_openapi_responses
-
-    exclude_paths = kwargs.get("exclude_paths", [])
-    max_depth = kwargs.get("max_depth", 3)
-
-    routes_processed = 0
-    errors_found = 0
-
-    for route in app.routes:
-        # Skip if path is in exclude list
-        if any(pattern in route.path for pattern in exclude_paths):
-            continue
-
-        if hasattr(route, "endpoint") and hasattr(route, "methods"):
-            try:
-                endpoint_func = route.endpoint
-
-                # Analyze the function for possible errors
-                analyzer = ErrorAnalyzer(
-                    endpoint_func, max_depth=max_depth, analyze_decorators=True
-                )
-                analysis = analyzer.analyze()
-                error_codes = analysis.get("error_codes", set())
-
-                if error_codes:
-                    # Generate OpenAPI responses
-                    openapi_responses = _generate_openapi_responses(error_codes, {})
-
-                    # Apply responses to the route
-                    if not hasattr(route, "responses"):
-                        route.responses = {}
-
-                    # Merge with existing responses (don't overwrite existing)
-                    for status_code, response_schema in openapi_responses.items():
-                        if status_code not in route.responses:
-                            route.responses[status_code] = response_schema
-
-                    routes_processed += 1
-                    errors_found += len(error_codes)
-
-                    logger.debug(
-                        f"Applied error responses to {route.path} "
-                        f"({', '.join(route.methods)}): {list(openapi_responses.keys())}"
-                    )
-
-            except Exception as e:
-                logger.warning(f"Failed to analyze errors for route {route.path}: {e}")
-
-        # Also handle included routers
-        elif hasattr(route, "app") and hasattr(route.app, "routes"):
-            _process_sub_routes(route.app.routes, exclude_paths, max_depth)
-
+    routes_processed, errors_found = _apply_auto_error_docs_to_routes(
+        app.routes, include_mounts=True, **kwargs
+    )
     logger.info(
         f"Processed {routes_processed} routes, found {errors_found} total error codes"
     )
 
 
-def _process_sub_routes(routes, exclude_paths, max_depth):
-    """Process routes in sub-applications/routers."""
-    from ..analysis.error_analyzer import ErrorAnalyzer
-    from ..analysis.decorators import _generate_openapi_responses
+def _iter_endpoint_routes(routes, is_excluded, include_mounts):
+    """Yield routes with an endpoint, skipping paths matched by ``is_excluded``.
 
-    for sub_route in routes:
+    With ``include_mounts``, routes of mounted sub-applications are yielded
+    too (one level deep).
+    """
+    for route in routes:
         # Skip if path is in exclude list
-        if any(pattern in sub_route.path for pattern in exclude_paths):
+        if is_excluded is not None and is_excluded(route.path):
             continue
 
-        if hasattr(sub_route, "endpoint") and hasattr(sub_route, "methods"):
-            try:
-                endpoint_func = sub_route.endpoint
-
-                analyzer = ErrorAnalyzer(
-                    endpoint_func, max_depth=max_depth, analyze_decorators=True
-                )
-                analysis = analyzer.analyze()
-                error_codes = analysis.get("error_codes", set())
-
-                if error_codes:
-                    openapi_responses = _generate_openapi_responses(error_codes, {})
-
-                    if not hasattr(sub_route, "responses"):
-                        sub_route.responses = {}
+        if hasattr(route, "endpoint") and hasattr(route, "methods"):
+            yield route
+        elif include_mounts and hasattr(getattr(route, "app", None), "routes"):
+            yield from _iter_endpoint_routes(route.app.routes, is_excluded, False)
 
-                    # Merge with existing responses
-                    for status_code, response_schema in openapi_responses.items():
-                        if status_code not in sub_route.responses:
-                            sub_route.responses[status_code] = response_schema
 
-                    logger.debug(
-                        f"Applied error responses to sub-route {sub_route.path}: "
-                        f"{list(openapi_responses.keys())}"
-                    )
+def _merge_responses(route, openapi_responses):
+    """Add generated responses to a route without overwriting existing ones.
 
-            except Exception as e:
-                logger.warning(
-                    f"Failed to analyze errors for sub-route {sub_route.path}: {e}"
-                )
+    Each route gets its own copy, since the generated responses are shared
+    between routes and with the decorated endpoint.
+    """
+    if not hasattr(route, "responses"):
+        route.responses = {}
+    for status_code, response_schema in openapi_responses.items():
+        if status_code not in route.responses:
+            route.responses[status_code] = copy.deepcopy(response_schema)
 
 
 def apply_auto_error_docs_to_router(router, **kwargs):
@@ -178,43 +208,44 @@ def apply_auto_error_docs_to_router(router, **kwargs):
         logger.error(f"Failed to apply error docs to router: {e}")
 
 
-def _apply_auto_error_docs_to_routes(routes, **kwargs):
-    """Apply automatic error documentation to a list of routes."""
-    from ..analysis.error_analyzer import ErrorAnalyzer
-    from ..analysis.decorators import _generate_openapi_responses
+def _apply_auto_error_docs_to_routes(routes, *, include_mounts=False, **kwargs):
+    """Apply automatic error documentation to a list of routes.
 
+    Returns:
+        Number of routes documented and total error codes found
+    """
     exclude_paths = kwargs.get("exclude_paths", [])
     max_depth = kwargs.get("max_depth", 3)
+    # A single alternation checks every substring pattern in one scan
+    is_excluded = (
+        re.compile("|".join(map(re.escape, exclude_paths))).search
+        if exclude_paths
+        else None
+    )
 
-    for route in routes:
-        # Skip if path is in exclude list
-        if any(pattern in route.path for pattern in exclude_paths):
-            continue
-
-        if hasattr(route, "endpoint") and hasattr(route, "methods"):
-            try:
-                endpoint_func = route.endpoint
-
-                analyzer = ErrorAnalyzer(
-                    endpoint_func, max_depth=max_depth, analyze_decorators=True
-                )
-                analysis = analyzer.analyze()
-                error_codes = analysis.get("error_codes", set())
+    routes_processed = 0
+    errors_found = 0
+    analyzed = {}
 
-                if error_codes:
-                    openapi_responses = _generate_openapi_responses(error_codes, {})
+    for route in _iter_endpoint_routes(routes, is_excluded, include_mounts):
+        try:
+            # Analyze the function for possible errors
+            error_codes, openapi_responses = _endpoint_error_responses(
+                route.endpoint, max_depth, analyzed
+            )
+            if not openapi_responses:
+                continue
 
-                    if not hasattr(route, "responses"):
-                        route.responses = {}
+            _merge_responses(route, openapi_responses)
+            routes_processed += 1
+            errors_found += len(error_codes)
 
-                    # Merge with existing responses
-                    for status_code, response_schema in openapi_responses.items():
-                        if status_code not in route.responses:
-                            route.responses[status_code] = response_schema
+            logger.debug(
+                f"Applied error responses to {route.path} "
+                f"({', '.join(route.methods)}): {list(openapi_responses.keys())}"
+            )
 
-                    logger.debug(
-                        f"Applied error responses to {route.path}: {list(openapi_responses.keys())}"
-                    )
+        except Exception as e:
+            logger.warning(f"Failed to analyze errors for route {route.path}: {e}")
 
-            except Exception as e:
-                logger.warning(f"Failed to analyze errors for route {route.path}: {e}")
+    return routes_processed, errors_found
@@ -8,13 +8,26 @@ from .core.exceptions import APIError
 
 ErrorType = TypeVar("ErrorType", bound=APIError)
 
+# Resolved once at import instead of on every handler check
+_HTTP_HANDLER_CLS: type | None = None
+try:  # pragma: no cover - optional dependency
+    from litestar.handlers.http_handlers import HTTPRouteHandler as _LoadedHandlerCls
+except ImportError:  # pragma: no cover
+    pass
+else:  # pragma: no cover
+    _HTTP_HANDLER_CLS = _LoadedHandlerCls
+
 
 def _is_http_route_handler(obj: object) -> bool:
-    try:  # pragma: no cover - optional dependency
-        from litestar.handlers.http_handlers import HTTPRouteHandler
-    except ImportError:  # pragma: no cover
-        return False
-    return isinstance(obj, HTTPRouteHandler)
+    return _HTTP_HANDLER_CLS is not None and isinstance(obj, _HTTP_HANDLER_CLS)
+
+
+def _extend_raises(handler: Any, errs: Iterable[Type[APIError]]) -> None:
+    """Append ``errs`` to a handler's ``raises`` list in a single copy."""
+    current = getattr(handler, "raises", None) or ()
+    if isinstance(current, dict):
+        current = ()
+    handler.raises = cast(Any, [*current, *errs])
 
 
 def raises_from(*errors: Type[APIError]) -> list[Type[APIError]]:
@@ -27,10 +40,7 @@ def errors(*errs: Type[APIError]):
 
     def wrap(obj: Any) -> Any:
         if _is_http_route_handler(obj):
-            current = getattr(obj, "raises", None) or []
-            if isinstance(current, dict):
-                current = []
-            obj.raises = cast(Any, [*list(current), *errs])
+            _extend_raises(obj, errs)
             return obj
         setattr(obj, "__api_errors__", errs)
         return obj
@@ -49,7 +59,4 @@ def apply_api_errors(handlers: Iterable[object]) -> None:
         )
         if not errs:
             continue
-        current = typed_handler.raises or []
-        if isinstance(current, dict):
-            current = []
-        typed_handler.raises = cast(Any, [*list(current), *errs])
+        _extend_raises(typed_handler, errs)
@@ -8,15 +8,15 @@ from typing import Any, Callable, Dict, Optional, cast
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import HTTPException, RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from sqlalchemy.exc import SQLAlchemyError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from ..core.error_codes import ErrorCode
+from ..core.error_codes import HTTP_STATUS_ERROR_CODES, ErrorCode
 from ..core.exceptions import AppError, ValidationError
-from ..core.renderers import ErrorResponseFormat, ErrorResponseRenderer, RenderResult
+from ..core.renderers import ErrorResponseFormat, ErrorResponseRenderer
 from ..converters.sql_converter import SQLErrorConverter
-from ..i18n.translator import ErrorTranslator
+from ..i18n.translator import ErrorTranslator, parse_accept_language
 
 logger = logging.getLogger(__name__)
 
@@ -76,7 +76,7 @@ class ErrorHandlerMiddleware:
         self.app.add_exception_handler(SQLAlchemyError, cast(Any, self._handle_sqlalchemy_error))
         self.app.add_exception_handler(Exception, cast(Any, self._handle_generic_error))
 
-    async def _handle_app_error(self, request: Request, exc: AppError) -> JSONResponse:
+    async def _handle_app_error(self, request: Request, exc: AppError) -> Response:
         locale = self._get_locale(request)
         translated_message = self._resolve_message(exc, locale)
 
@@ -99,20 +99,21 @@ class ErrorHandlerMiddleware:
                 Details=exc.details,
             )
 
-        rendered: RenderResult = self.renderer.render(
+        # Encoded by the renderer with msgspec, straight from its structs
+        content, media_type = self.renderer.render_bytes(
             exc, message=translated_message, request=request
         )
 
-        return JSONResponse(
-            content=rendered.payload,
+        return Response(
+            content=content,
             status_code=exc.status_code,
-            media_type=rendered.media_type,
+            media_type=media_type,
             headers={"X-Request-ID": exc.request_id or "unknown"},
         )
 
     async def _handle_validation_error(
         self, request: Request, exc: RequestValidationError
-    ) -> JSONResponse:
+    ) -> Response:
         details = {"errors": exc.errors()}
 
         error = ValidationError(
@@ -125,16 +126,8 @@ class ErrorHandlerMiddleware:
 
     async def _handle_http_exception(
         self, request: Request, exc: HTTPException
-    ) -> JSONResponse:
-        status_to_code = {
-            400: ErrorCode.INVALID_INPUT,
-            401: ErrorCode.AUTH_REQUIRED,
-            403: ErrorCode.AUTH_PERMISSION_DENIED,
-            404: ErrorCode.RESOURCE_NOT_FOUND,
-            422: ErrorCode.VALIDATION_FAILED,
-        }
-
-        error_code = status_to_code.get(exc.status_code, ErrorCode.UNKNOWN_ERROR)
+    ) -> Response:
+        error_code = HTTP_STATUS_ERROR_CODES.get(exc.status_code, ErrorCode.UNKNOWN_ERROR)
         details = {"http_detail": exc.detail}
 
         error = AppError(
@@ -157,13 +150,13 @@ class ErrorHandlerMiddleware:
 
     async def _handle_sqlalchemy_error(
         self, request: Request, exc: SQLAlchemyError
-    ) -> JSONResponse:
+    ) -> Response:
         error = SQLErrorConverter.convert(exc)
         return await self._handle_app_error(request, error)
 
     async def _handle_generic_error(
         self, request: Request, exc: Exception
-    ) -> JSONResponse:
+    ) -> Response:
         if self.log_errors:
             logger.exception("Unhandled exception")
 
@@ -187,7 +180,7 @@ class ErrorHandlerMiddleware:
     def _get_locale(self, request: Request) -> Optional[str]:
         accept_language = request.headers.get("Accept-Language", "")
         if accept_language:
-            return accept_language.split(",")[0].split("-")[0]
+            return parse_accept_language(accept_language)
         return None
 
     def _resolve_message(self, error: AppError, locale: Optional[str]) -> str:
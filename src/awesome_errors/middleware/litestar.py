@@ -13,11 +13,11 @@ if TYPE_CHECKING:
     from litestar.response import Response
     from litestar.types import ExceptionHandler
 
-from ..core.error_codes import ErrorCode
+from ..core.error_codes import HTTP_STATUS_ERROR_CODES, ErrorCode
 from ..core.exceptions import AppError, ValidationError as CoreValidationError
-from ..core.renderers import ErrorResponseFormat, ErrorResponseRenderer, RenderResult
+from ..core.renderers import ErrorResponseFormat, ErrorResponseRenderer
 from ..converters.sql_converter import SQLErrorConverter
-from ..i18n.translator import ErrorTranslator
+from ..i18n.translator import ErrorTranslator, parse_accept_language
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +78,7 @@ def create_litestar_exception_handlers(
     def handle_app_error(request: "Request", exc: AppError) -> "Response":
         locale = request.headers.get("Accept-Language")
         if locale:
-            locale = locale.split(",")[0].split("-")[0]
+            locale = parse_accept_language(locale)
 
         if log_errors:
             if exc.code.value not in suppressed_codes:
@@ -103,14 +103,14 @@ def create_litestar_exception_handlers(
                 Details=exc.details,
             )
 
-        rendered: RenderResult = renderer.render(
+        content, media_type = renderer.render_bytes(
             exc, message=resolve_message(exc, locale), request=request
         )
 
         return Response(
-            content=rendered.payload,
+            content=content,
             status_code=exc.status_code,
-            media_type=rendered.media_type,
+            media_type=media_type,
             headers={"X-Request-ID": exc.request_id or "unknown"},
         )
 
@@ -136,15 +136,9 @@ def create_litestar_exception_handlers(
         return handle_app_error(request, error)
 
     def handle_http_exception(request: "Request", exc: "HTTPException") -> "Response":
-        status_to_code = {
-            400: ErrorCode.INVALID_INPUT,
-            401: ErrorCode.AUTH_REQUIRED,
-            403: ErrorCode.AUTH_PERMISSION_DENIED,
-            404: ErrorCode.RESOURCE_NOT_FOUND,
-            422: ErrorCode.VALIDATION_FAILED,
-        }
-
-        error_code = status_to_code.get(exc.status_code, ErrorCode.UNKNOWN_ERROR)
+        error_code = HTTP_STATUS_ERROR_CODES.get(
+            exc.status_code, ErrorCode.UNKNOWN_ERROR
+        )
         error = AppError(
             code=error_code,
             message=str(exc.detail or exc.extra or exc.__class__.__name__),
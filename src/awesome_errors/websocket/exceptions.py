@@ -8,6 +8,7 @@ the existing awesome-errors system while adding JSON-RPC 2.0 support.
 from typing import Any, Dict, Optional
 
 from awesome_errors.core.error_codes import ErrorCode
+from awesome_errors.core.error_response import _isoformat_utc
 from awesome_errors.core.exceptions import AppError
 
 
@@ -38,6 +39,8 @@ class WebSocketError(AppError):
     providing automatic error code mapping and connection management.
     """
 
+    __slots__ = ("ws_error_code", "close_connection")
+
     def __init__(
         self,
         code: ErrorCode,
@@ -119,7 +122,7 @@ class WebSocketError(AppError):
             error_data["error_code"] = self.code.value
 
             # Include timestamp for debugging
-            error_data["timestamp"] = self.timestamp.isoformat() + "Z"
+            error_data["timestamp"] = _isoformat_utc(self.timestamp)
 
             # Include request ID if available
             if self.request_id:
@@ -159,6 +162,8 @@ class WebSocketError(AppError):
 class WebSocketAuthError(WebSocketError):
     """Authentication error - always closes connection"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Authentication required",
@@ -178,6 +183,8 @@ class WebSocketAuthError(WebSocketError):
 class WebSocketTokenExpiredError(WebSocketError):
     """Token expired error - requires re-authentication"""
 
+    __slots__ = ()
+
     def __init__(
         self, request_id: Optional[str] = None, details: Optional[Dict[str, Any]] = None
     ):
@@ -194,6 +201,8 @@ class WebSocketTokenExpiredError(WebSocketError):
 class WebSocketRateLimitError(WebSocketError):
     """Rate limit exceeded error"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         retry_after: int,
@@ -220,6 +229,8 @@ class WebSocketRateLimitError(WebSocketError):
 class WebSocketValidationError(WebSocketError):
     """Validation error with field details"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -243,6 +254,8 @@ class WebSocketValidationError(WebSocketError):
 class WebSocketMethodNotFoundError(WebSocketError):
     """Method not found error"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         method: str,
@@ -266,6 +279,8 @@ class WebSocketMethodNotFoundError(WebSocketError):
 class WebSocketInternalError(WebSocketError):
     """Internal server error"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Internal server error",
@@ -15,6 +15,13 @@ from awesome_errors import (
 )
 
 
+def _integrity_error(message):
+    """Build an IntegrityError whose driver error renders as ``message``."""
+    orig_error = Mock()
+    orig_error.__str__ = lambda self: message
+    return IntegrityError("statement", "params", orig_error)
+
+
 class TestSQLErrorConverter:
     """Test SQL error converter."""
 
@@ -64,6 +71,143 @@ class TestSQLErrorConverter:
         assert result.code == ErrorCode.DB_MISSING_REQUIRED
         assert "Required field" in result.message
 
+    def test_integrity_error_classification(self):
+        """Test classification of driver messages from each dialect."""
+        cases = [
+            # PostgreSQL
+            (
+                'duplicate key value violates unique constraint "users_email_key"',
+                ErrorCode.DB_DUPLICATE_ENTRY,
+            ),
+            (
+                'insert or update on table "orders" violates foreign key '
+                'constraint "orders_user_id_fkey"',
+                ErrorCode.DB_INVALID_REFERENCE,
+            ),
+            (
+                'null value in column "email" of relation "users" '
+                "violates not-null constraint",
+                ErrorCode.DB_MISSING_REQUIRED,
+            ),
+            (
+                'new row for relation "products" violates check constraint "price"',
+                ErrorCode.DB_CONSTRAINT_VIOLATION,
+            ),
+            # MySQL
+            (
+                "(1062, \"Duplicate entry 'a@b.com' for key 'users.email'\")",
+                ErrorCode.DB_DUPLICATE_ENTRY,
+            ),
+            (
+                "(1452, 'Cannot add or update a child row: a foreign key "
+                "constraint fails (`shop`.`orders`)')",
+                ErrorCode.DB_INVALID_REFERENCE,
+            ),
+            (
+                "(1048, \"Column 'email' cannot be null\")",
+                ErrorCode.DB_MISSING_REQUIRED,
+            ),
+            # SQLite
+            ("UNIQUE constraint failed: users.email", ErrorCode.DB_DUPLICATE_ENTRY),
+            ("FOREIGN KEY constraint failed", ErrorCode.DB_INVALID_REFERENCE),
+            ("NOT NULL constraint failed: users.email", ErrorCode.DB_MISSING_REQUIRED),
+            # Unrecognized messages fall back to a generic constraint violation
+            ("CHECK constraint failed: price", ErrorCode.DB_CONSTRAINT_VIOLATION),
+        ]
+
+        for message, expected_code in cases:
+            result = SQLErrorConverter.convert(_integrity_error(message))
+            assert result.code == expected_code, message
+
+    def test_integrity_error_earliest_pattern_wins(self):
+        """Test that the pattern matching earliest in the message classifies it."""
+        result = SQLErrorConverter.convert(
+            _integrity_error(
+                'insert on table "a" violates foreign key constraint "fk"; '
+                'duplicate key value violates unique constraint "u"'
+            )
+        )
+
+        assert result.code == ErrorCode.DB_INVALID_REFERENCE
+
+    def test_postgresql_detail_extraction(self):
+        """Test extraction of table, field, constraint and value from PostgreSQL."""
+        duplicate = SQLErrorConverter.convert(
+            _integrity_error(
+                'duplicate key value violates unique constraint "users_email_key"\n'
+                "DETAIL:  Key (email)=(a@b.com) already exists."
+            )
+        )
+        assert duplicate.details["constraint"] == "users_email_key"
+        assert duplicate.details["duplicate_value"] == "a@b.com"
+        assert duplicate.message == "Record already exists: a@b.com"
+
+        not_null = SQLErrorConverter.convert(
+            _integrity_error(
+                'null value in column "email" of relation "users" '
+                "violates not-null constraint"
+            )
+        )
+        assert not_null.details["table"] == "users"
+        assert not_null.details["field"] == "email"
+        assert not_null.message == "Required field is missing: email"
+
+        check = SQLErrorConverter.convert(
+            _integrity_error(
+                'new row for relation "products" violates check constraint "price"'
+            )
+        )
+        assert check.details["table"] == "products"
+        assert check.details["constraint"] == "price"
+
+    def test_mysql_detail_extraction(self):
+        """Test extraction of table, field, constraint and value from MySQL."""
+        duplicate = SQLErrorConverter.convert(
+            _integrity_error(
+                "(1062, \"Duplicate entry 'a@b.com' for key 'users.email'\")"
+            )
+        )
+        assert duplicate.details["constraint"] == "users.email"
+        assert duplicate.details["duplicate_value"] == "a@b.com"
+
+        foreign_key = SQLErrorConverter.convert(
+            _integrity_error(
+                "(1452, 'Cannot add or update a child row: a foreign key "
+                "constraint fails (`shop`.`orders`, CONSTRAINT `orders_ibfk_1` "
+                "FOREIGN KEY (`user_id`) REFERENCES `users` (`id`))')"
+            )
+        )
+        assert foreign_key.details["table"] == "orders"
+
+        not_null = SQLErrorConverter.convert(
+            _integrity_error("(1048, \"Column 'email' cannot be null\")")
+        )
+        assert not_null.details["field"] == "email"
+        assert not_null.message == "Required field is missing: email"
+
+    def test_sqlite_detail_extraction(self):
+        """Test that SQLite's ``table.column`` messages add no extracted details."""
+        result = SQLErrorConverter.convert(
+            _integrity_error("NOT NULL constraint failed: users.email")
+        )
+
+        assert result.code == ErrorCode.DB_MISSING_REQUIRED
+        for key in ("table", "field", "constraint", "duplicate_value"):
+            assert key not in result.details
+
+    def test_detail_extraction_prefers_dialect_priority(self):
+        """Test that the highest-priority pattern wins when several match."""
+        result = SQLErrorConverter.convert(
+            _integrity_error(
+                "null value in column email_raw of table staging violates "
+                'not-null constraint; column "email" of relation "users"'
+            )
+        )
+
+        # The quoted PostgreSQL forms win over the later SQLite-style ones
+        assert result.details["field"] == "email"
+        assert result.details["table"] == "users"
+
     def test_data_error_conversion(self):
         """Test conversion of data errors."""
         orig_error = Mock()
@@ -233,6 +377,27 @@ class TestPydanticErrorConverter:
 
             assert any("nested" in path for path in field_paths)
 
+    def test_convert_many(self):
+        """Test batch conversion keeps one error per input, in order."""
+        from pydantic import BaseModel
+
+        class TestModel(BaseModel):
+            value: int
+
+        errors = []
+        for payload in ({"value": "x"}, {}):
+            try:
+                TestModel(**payload)
+            except PydanticValidationError as e:
+                errors.append(e)
+
+        results = PydanticErrorConverter.convert_many(errors)
+
+        assert [r.details["field_errors"][0]["type"] for r in results] == [
+            "int_parsing",
+            "missing",
+        ]
+
 
 class TestUniversalErrorConverter:
     """Test universal error converter."""
@@ -318,6 +483,30 @@ class TestUniversalErrorConverter:
         assert "error_str" in result.details
         assert "error_attrs" in result.details
 
+    def test_registered_converter(self, monkeypatch):
+        """Test that registered converters handle subclasses too."""
+        from awesome_errors.converters import register_converter
+        from awesome_errors.converters import universal_converter
+
+        class PaymentError(Exception):
+            pass
+
+        class CardDeclinedError(PaymentError):
+            pass
+
+        monkeypatch.setattr(
+            universal_converter, "_CONVERTERS", dict(universal_converter._CONVERTERS)
+        )
+        register_converter(
+            PaymentError, lambda error: NotFoundError("payment", str(error))
+        )
+
+        result = UniversalErrorConverter.convert(CardDeclinedError("42"))
+        universal_converter._resolve_converter.cache_clear()
+
+        assert isinstance(result, NotFoundError)
+        assert result.details["resource_id"] == "42"
+
     def test_unknown_error_production_mode(self):
         """Test unknown error handling in production mode."""
 
@@ -1,5 +1,10 @@
+import copy
+import pickle
+
 import pytest
 from datetime import datetime
+
+import awesome_errors
 from awesome_errors import (
     AppError,
     ValidationError,
@@ -9,6 +14,43 @@ from awesome_errors import (
     BusinessLogicError,
     ErrorCode,
 )
+from awesome_errors.core.exceptions import _slot_names
+
+
+def _round_trips(error):
+    """Return ``error`` after copy, deepcopy and pickle round trips."""
+    return [
+        copy.copy(error),
+        copy.deepcopy(error),
+        pickle.loads(pickle.dumps(error)),
+    ]
+
+
+# Every exported AppError subclass, so new ones are covered automatically
+_EXPORTED_ERRORS = [
+    getattr(awesome_errors, name)
+    for name in awesome_errors.__all__
+    if isinstance(getattr(awesome_errors, name), type)
+    and issubclass(getattr(awesome_errors, name), AppError)
+]
+
+# Constructor arguments for classes that do not take a leading string
+_CONSTRUCTOR_ARGS = {
+    "AppError": (ErrorCode.INTERNAL_ERROR, "Test"),
+    "WebSocketError": (ErrorCode.INTERNAL_ERROR, "Test"),
+    "WebSocketRateLimitError": (30,),
+}
+
+
+def _assert_same_error(clone, error):
+    assert type(clone) is type(error)
+    assert clone.args == error.args
+    assert clone.code == error.code
+    assert clone.message == error.message
+    assert clone.details == error.details
+    assert clone.status_code == error.status_code
+    assert clone.timestamp == error.timestamp
+    assert clone.request_id == error.request_id
 
 
 class TestCoreExceptions:
@@ -36,6 +78,27 @@ class TestCoreExceptions:
         assert error.code == ErrorCode("CUSTOM_ERROR")
         assert error.message == "Custom error message"
 
+    def test_error_code_get(self):
+        """Test ErrorCode.get lookup for known and custom codes."""
+        assert ErrorCode.get("USER_NOT_FOUND") is ErrorCode.USER_NOT_FOUND
+        assert ErrorCode.get("CUSTOM_ERROR") == ErrorCode("CUSTOM_ERROR")
+
+    def test_custom_error_code_is_reused(self):
+        """Test that repeated custom codes resolve to one pseudo member."""
+        assert ErrorCode("REUSED_CUSTOM") is ErrorCode("REUSED_CUSTOM")
+        assert ErrorCode.get("REUSED_CUSTOM") is ErrorCode("REUSED_CUSTOM")
+
+    def test_custom_error_codes_do_not_grow_member_table(self):
+        """Test that custom codes stay out of the defined-member lookup table."""
+        from awesome_errors.core import error_codes
+
+        size = len(error_codes._CODE_CACHE)
+        for i in range(10):
+            ErrorCode.get(f"UNBOUNDED_CUSTOM_{i}")
+
+        assert len(error_codes._CODE_CACHE) == size
+        assert error_codes._custom_code.cache_info().maxsize is not None
+
     def test_app_error_to_dict(self):
         """Test AppError to_dict conversion."""
         error = AppError(
@@ -208,6 +271,7 @@ class TestCoreExceptions:
 
         # Should be ISO format with Z suffix
         assert timestamp_str.endswith("Z")
+        assert "+00:00" not in timestamp_str
         assert "T" in timestamp_str
 
     def test_unique_request_ids(self):
@@ -245,6 +309,50 @@ class TestCoreExceptions:
         assert error.details == {}
         assert isinstance(error.details, dict)
 
+    def test_copy_and_pickle_preserve_state(self):
+        """Test that copies and unpickled errors keep every attribute."""
+        errors = [
+            AppError(ErrorCode.INTERNAL_ERROR, "Test", {"key": "value"}),
+            AppError("CUSTOM_ERROR", "Custom"),
+            NotFoundError("user", 1),
+            ValidationError("bad", field="email", value="x"),
+            DatabaseError("Insert failed", sql_error="INSERT ...", table="users"),
+        ]
+
+        for error in errors:
+            error.extra = "kept"
+            for clone in _round_trips(error):
+                _assert_same_error(clone, error)
+                assert clone.extra == "kept"
+
+    def test_copy_does_not_rerun_init(self):
+        """Test that copies are not rebuilt from the formatted message."""
+        error = NotFoundError("user", 1)
+        clone = pickle.loads(pickle.dumps(error))
+
+        assert clone.message == "user not found with id: 1"
+        assert clone.details == {"resource": "user", "resource_id": 1}
+
+    def test_deepcopy_details_are_independent(self):
+        """Test that a deep copy does not share the details dict."""
+        error = ValidationError("bad", field="email")
+        clone = copy.deepcopy(error)
+        clone.details["field"] = "name"
+
+        assert error.details["field"] == "email"
+
+
+@pytest.mark.parametrize("error_cls", _EXPORTED_ERRORS, ids=lambda cls: cls.__name__)
+def test_exported_errors_round_trip(error_cls):
+    """Test copy, deepcopy and pickle for every exported AppError subclass."""
+    error = error_cls(*_CONSTRUCTOR_ARGS.get(error_cls.__name__, ("Test",)))
+
+    for clone in _round_trips(error):
+        _assert_same_error(clone, error)
+        # Slots declared by subclasses, e.g. WebSocketError's, survive too
+        for name in _slot_names(error_cls):
+            assert getattr(clone, name) == getattr(error, name)
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -1,3 +1,4 @@
+import sys
 import pytest
 from awesome_errors import (
     analyze_errors,
@@ -258,6 +259,95 @@ class TestErrorDecorators:
 
         assert found_examples, "No examples were generated"
 
+    def test_decorators_return_original_function(self):
+        """Test that decorators attach metadata without wrapping."""
+
+        def test_func():
+            raise NotFoundError("user", 123)
+
+        assert analyze_errors()(test_func) is test_func
+        assert openapi_errors()(test_func) is test_func
+        assert test_func._openapi_error_responses is not None
+
+    def test_stacked_decorators_analyze_once(self, monkeypatch):
+        """Test that stacking decorators reuses a single analysis."""
+        from awesome_errors.analysis import decorators
+
+        calls = []
+        original_analyze = decorators._analyze_from_module
+
+        def counting_analyze(func):
+            calls.append(func)
+            return original_analyze(func)
+
+        monkeypatch.setattr(decorators, "_analyze_from_module", counting_analyze)
+
+        @openapi_errors()
+        @analyze_errors()
+        def test_func():
+            raise NotFoundError("user", 123)
+
+        assert len(calls) == 1
+        assert "RESOURCE_NOT_FOUND" in test_func._error_analysis["error_codes"]
+
+    def test_cached_analysis_isolated_from_callers(self):
+        """Test that mutating an attached analysis does not alter the cache."""
+
+        def test_func():
+            raise NotFoundError("user", 123)
+
+        first = analyze_errors()(test_func)._error_analysis
+        first["error_codes"].append("CORRUPTED")
+        first["error_details"].clear()
+
+        del test_func._error_analysis
+        second = analyze_errors()(test_func)._error_analysis
+        assert "CORRUPTED" not in second["error_codes"]
+        assert second["error_details"]
+
+    def test_disk_cache_skips_reanalysis(self, monkeypatch, tmp_path):
+        """Test that the opt-in disk cache is reused across processes."""
+        from awesome_errors.analysis import decorators
+        from awesome_errors.analysis.error_analyzer import ErrorAnalyzer
+
+        monkeypatch.setenv("AWESOME_ERRORS_CACHE_DIR", str(tmp_path))
+
+        def test_func():
+            raise NotFoundError("user", 123)
+
+        analyze_errors()(test_func)
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        # Simulate a fresh process: in-memory cache empty, analyzer unusable
+        monkeypatch.setattr(decorators, "_ANALYSIS_CACHE", {})
+
+        def fail_analyze(self):
+            raise AssertionError("analysis should come from the disk cache")
+
+        monkeypatch.setattr(ErrorAnalyzer, "analyze", fail_analyze)
+
+        cached = analyze_errors()(test_func)
+        assert "RESOURCE_NOT_FOUND" in cached._error_analysis["error_codes"]
+
+    def test_codegen_precomputes_disk_cache(self, monkeypatch, tmp_path):
+        """Test that the codegen entry point fills the disk cache."""
+        from awesome_errors.analysis import codegen
+
+        cache_dir = tmp_path / "cache"
+        (tmp_path / "codegen_endpoints.py").write_text(
+            "from awesome_errors import NotFoundError, openapi_errors\n"
+            "\n"
+            "@openapi_errors()\n"
+            "def get_item():\n"
+            "    raise NotFoundError('item', 1)\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.setenv("AWESOME_ERRORS_CACHE_DIR", "")
+        monkeypatch.delitem(sys.modules, "codegen_endpoints", raising=False)
+
+        assert codegen.main(["codegen_endpoints", "--cache-dir", str(cache_dir)]) == 0
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
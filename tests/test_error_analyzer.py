@@ -5,6 +5,7 @@ from awesome_errors import (
     ValidationError,
     AuthError,
     ErrorCode,
+    UserNotFoundError,
 )
 
 
@@ -274,6 +275,49 @@ def test_func():
         )
         assert result["total_errors"] > 0
 
+    def test_specific_error_subclass_default_code(self):
+        """Test that AppError subclasses resolve to their default error code."""
+
+        def test_func():
+            raise UserNotFoundError(123)
+
+        result = ErrorAnalyzer(test_func).analyze()
+
+        assert "USER_NOT_FOUND" in result["error_codes"]
+        assert result["error_details"][0]["type"] == "UserNotFoundError"
+
+    def test_known_decorator_errors(self):
+        """Test that known decorators contribute their possible errors."""
+
+        def require_auth(func):
+            return func
+
+        @require_auth
+        def test_func():
+            return None
+
+        result = ErrorAnalyzer(test_func).analyze()
+
+        assert "AUTH_REQUIRED" in result["error_codes"]
+        assert result["decorator_errors"][0]["decorator"] == "require_auth"
+
+    def test_analyze_module(self):
+        """Test single-pass analysis of every function in a module."""
+        import sys
+
+        def test_func():
+            raise NotFoundError("user", 123)
+
+        results = ErrorAnalyzer.analyze_module(sys.modules[__name__])
+
+        assert "MockQuery.first" in results
+        assert results[test_func.__qualname__] == ErrorAnalyzer(test_func).analyze()
+
+    def test_analyze_without_function(self):
+        """Test that an analyzer without a target function refuses analyze()."""
+        with pytest.raises(ValueError):
+            ErrorAnalyzer(None).analyze()
+
 
 # Mock objects for testing method calls
 class MockSession:
@@ -221,6 +221,55 @@ class TestErrorTranslator:
         assert result_lower == "User not found"
         assert result_upper == "USER_NOT_FOUND"
 
+    def test_parse_accept_language(self):
+        """Test extraction of the primary language from Accept-Language."""
+        from awesome_errors.i18n.translator import parse_accept_language
+
+        assert parse_accept_language("uk-UA,uk;q=0.9,en;q=0.8") == "uk"
+        assert parse_accept_language("en") == "en"
+
+    def test_unchanged_translations_not_rewritten(self, monkeypatch, tmp_path):
+        """Test that persisting an unchanged payload skips the file write."""
+        from awesome_errors.i18n import translator as translator_module
+
+        translator = ErrorTranslator(locales_dir=tmp_path / "locales")
+        translator.add_translations("test", {"TEST_ERROR": "Test error"})
+
+        writes = []
+        original_write = translator_module._write_translations
+
+        def counting_write(path, translations):
+            writes.append(path)
+            original_write(path, translations)
+
+        monkeypatch.setattr(translator_module, "_write_translations", counting_write)
+
+        translator.add_translations("test", {"TEST_ERROR": "Test error"})
+        assert writes == []
+
+        # A pending ephemeral change is still written on the next persist
+        translator.add_translations("test", {"OTHER": "Other"}, persist=False)
+        translator.add_translations("test", {"OTHER": "Other"})
+        assert len(writes) == 1
+        saved = json.loads((tmp_path / "locales" / "test" / "errors.json").read_text())
+        assert saved == {"TEST_ERROR": "Test error", "OTHER": "Other"}
+
+    def test_concurrent_persist_same_locale(self, tmp_path):
+        """Test that threads persisting one locale do not clash on the temp file."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        translator = ErrorTranslator(locales_dir=tmp_path / "locales")
+
+        def persist(i):
+            translator.add_translations("test", {f"ERROR_{i}": f"Error {i}"})
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(persist, range(64)))
+
+        locale_dir = tmp_path / "locales" / "test"
+        assert [p.name for p in locale_dir.iterdir()] == ["errors.json"]
+        assert json.loads((locale_dir / "errors.json").read_text())
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -342,6 +342,98 @@ class TestIntegration:
         endpoint_spec = paths["/schema-test"]["get"]
         assert "responses" in endpoint_spec
 
+    def test_automatic_docs_reuse_decorator_responses(self):
+        """Test that automatic docs reuse responses built by @openapi_errors."""
+        from awesome_errors import setup_automatic_error_docs
+
+        @openapi_errors(custom_descriptions={"RESOURCE_NOT_FOUND": "No such thing"})
+        @self.app.get("/auto-docs-test")
+        def auto_docs_test():
+            raise NotFoundError("thing")
+
+        # Schema generated before setup must not hide the new responses
+        self.client.get("/openapi.json")
+        setup_automatic_error_docs(self.app)
+
+        schema = self.client.get("/openapi.json").json()
+        response_404 = schema["paths"]["/auto-docs-test"]["get"]["responses"]["404"]
+        examples = response_404["content"]["application/json"]["examples"]
+        assert examples["resource-not-found"]["description"] == "No such thing"
+
+    def test_automatic_docs_analyze_shared_endpoint_once(self, monkeypatch):
+        """Test that an endpoint mounted on several routes is analyzed once."""
+        from awesome_errors import setup_automatic_error_docs
+        from awesome_errors.analysis.error_analyzer import ErrorAnalyzer
+
+        def shared_endpoint():
+            raise NotFoundError("thing")
+
+        self.app.add_api_route("/shared-a", shared_endpoint)
+        self.app.add_api_route("/shared-b", shared_endpoint)
+
+        analyzed = []
+        original_analyze = ErrorAnalyzer.analyze
+
+        def counting_analyze(analyzer):
+            analyzed.append(analyzer.function)
+            return original_analyze(analyzer)
+
+        monkeypatch.setattr(ErrorAnalyzer, "analyze", counting_analyze)
+        setup_automatic_error_docs(self.app)
+
+        assert analyzed.count(shared_endpoint) == 1
+        paths = self.client.get("/openapi.json").json()["paths"]
+        assert "404" in paths["/shared-a"]["get"]["responses"]
+        assert "404" in paths["/shared-b"]["get"]["responses"]
+
+    def test_automatic_docs_distinguish_wrapped_endpoints(self):
+        """Test that endpoints sharing a functools.wraps wrapper keep their errors."""
+        import functools
+
+        from awesome_errors import setup_automatic_error_docs
+
+        def deco(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        @deco
+        def get_item():
+            raise NotFoundError("item")
+
+        @deco
+        def login():
+            raise AuthError("Invalid credentials")
+
+        self.app.add_api_route("/item", get_item)
+        self.app.add_api_route("/login", login)
+        setup_automatic_error_docs(self.app)
+
+        paths = self.client.get("/openapi.json").json()["paths"]
+        assert "404" in paths["/item"]["get"]["responses"]
+        assert "401" in paths["/login"]["get"]["responses"]
+        assert "404" not in paths["/login"]["get"]["responses"]
+
+    def test_error_route_registers_documented_endpoint(self):
+        """Test the fused route + error documentation decorator."""
+        from awesome_errors import error_route
+
+        @error_route(self.app, "get", "/fused/{item_id}")
+        def fused(item_id: int):
+            if item_id == 404:
+                raise NotFoundError("item", item_id)
+            return {"id": item_id}
+
+        assert self.client.get("/fused/1").json() == {"id": 1}
+        assert self.client.get("/fused/404").status_code == 404
+
+        schema = self.client.get("/openapi.json").json()
+        responses = schema["paths"]["/fused/{item_id}"]["get"]["responses"]
+        assert "404" in responses
+        assert fused._error_analysis["error_codes"] == ["RESOURCE_NOT_FOUND"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,46 @@
+import pytest
+import msgspec
+from awesome_errors import (
+    ErrorResponseFormat,
+    ErrorResponseRenderer,
+    NotFoundError,
+)
+
+
+class TestErrorResponseRenderer:
+    """Test encoded error responses."""
+
+    def _error(self):
+        error = NotFoundError("user", 123)
+        error.details["filters"] = {"active": True, "roles": ["admin"]}
+        return error
+
+    def test_legacy_render_bytes_matches_render(self):
+        """Test that legacy bytes match the encoded ``render`` payload."""
+        renderer = ErrorResponseRenderer()
+        error = self._error()
+
+        content, media_type = renderer.render_bytes(error, message="Not found")
+        rendered = renderer.render(error, message="Not found")
+
+        assert media_type == rendered.media_type == "application/json"
+        assert content == msgspec.json.encode(rendered.payload)
+        assert msgspec.json.decode(content) == rendered.payload
+        assert msgspec.json.decode(content)["error"]["timestamp"].endswith("Z")
+
+    def test_problem_detail_render_bytes_matches_render(self):
+        """Test that RFC 7807 bytes match the encoded ``render`` payload."""
+        renderer = ErrorResponseRenderer(ErrorResponseFormat.RFC7807)
+        error = self._error()
+
+        content, media_type = renderer.render_bytes(error, message="Not found")
+        rendered = renderer.render(error, message="Not found")
+
+        assert media_type == rendered.media_type == "application/problem+json"
+        assert content == msgspec.json.encode(rendered.payload)
+        assert msgspec.json.decode(content) == rendered.payload
+        assert msgspec.json.decode(content)["timestamp"].endswith("Z")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])